@@ -3,6 +3,7 @@ const nextConfig = {
   reactStrictMode: true,
   swcMinify: true,
   images: {
+    unoptimized: process.env.NEXT_EXPORT === "true",
     dangerouslyAllowSVG: true,
     domains: ["res.cloudinary.com",
     "images.unsplash.com",
@@ -1,10 +1,36 @@
+import asyncio
+
 import pytest
+import pytest_asyncio
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright
 
+from functional.crawler import page_paths
+from functional.failure_capture import item_failed
+from functional.network import network_router
+from functional.paths import REPORTS_DIR
+
+pytest_plugins = [
+    "functional.plugins.benchmark",
+    "functional.plugins.context_pool",
+    "functional.plugins.crawl",
+    "functional.plugins.failure_capture",
+    "functional.plugins.har",
+    "functional.plugins.impact",
+    "functional.plugins.locators",
+    "functional.plugins.perf",
+    "functional.plugins.phase_timing",
+    "functional.plugins.routing",
+    "functional.plugins.sharding",
+    "functional.plugins.static_server",
+    "functional.plugins.visual_regression",
+    "functional.plugins.waterfall",
+]
+
 
 @pytest.fixture(scope="session")
-def base_url():
-    return "https:localhost:3000"
+def base_url(static_site):
+    return static_site
 
 
 @pytest.fixture(scope="session")
@@ -14,25 +40,84 @@ def sync_playwright_context():
 
 
 @pytest.fixture(scope="session")
-def browser(sync_playwright_context):
-    browser = sync_playwright_context.chromium.launch()
+def browser(sync_playwright_context, launch_options):
+    browser = sync_playwright_context.chromium.launch(**launch_options)
     yield browser
     browser.close()
 
 
 @pytest.fixture
-def sync_page(browser):
-    context = browser.new_context()
-    page = context.new_page()
+def sync_page(context_pool, request, asset_cache, har_archive, failure_capture):
+    context, page = context_pool.acquire()
+    route_handler = network_router(request, asset_cache, har_archive).handle
+    context.route("**/*", route_handler)
+    failure_capture.start(context, request.node.nodeid)
+    yield page
+    failure_capture.finish(context, page, request.node.nodeid, item_failed(request.node))
+    context.unroute("**/*", route_handler)
+    context_pool.release(context, page)
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_playwright_context():
+    async with async_playwright() as p:
+        yield p
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_browser(async_playwright_context):
+    browser = await async_playwright_context.chromium.launch()
+    yield browser
+    await browser.close()
+
+
+@pytest_asyncio.fixture
+async def async_context(async_browser, request, asset_cache, har_archive):
+    context = await async_browser.new_context()
+    await context.route("**/*", network_router(request, asset_cache, har_archive).handle_async)
+    yield context
+    await context.close()
+
+
+@pytest_asyncio.fixture
+async def async_page(async_context):
+    page = await async_context.new_page()
     yield page
+
+
+@pytest.fixture(scope="module")
+def page_snapshot(browser, request, asset_cache, har_archive):
+    context = browser.new_context()
+    context.route("**/*", network_router(request, asset_cache, har_archive).handle)
+    snapshots = {}
+
+    def _snapshot(page_class, url):
+        key = (page_class, url)
+        if key in snapshots:
+            snapshots[key].visited()
+        else:
+            page_object = page_class(context.new_page())
+            page_object.open(url)
+            snapshots[key] = page_object
+        return snapshots[key]
+
+    yield _snapshot
     context.close()
 
 
+@pytest.fixture(scope="session")
+def reports_dir():
+    REPORTS_DIR.mkdir(exist_ok=True)
+    return REPORTS_DIR
+
+
 @pytest.fixture
-def additional_paths():
-    return [
-        ("https:localhost:3000", "homepage"),
-        ("https:localhost:3000/about", "about page"),
-        ("https:localhost:3000/blogs", "blogs page"),
-        ("https:localhost:3000/blogs/python-type-checking", "blog page")
-    ]
+def additional_paths(base_url):
+    return [(f"{base_url}{path}", test_id) for path, test_id in page_paths()]
@@ -0,0 +1,126 @@
+from collections import deque
+from urllib.parse import urlparse
+
+from playwright.sync_api import Error
+
+from functional.failure_capture import TRACING_OPTIONS
+
+CLEAR_STORAGE_SCRIPT = """async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (navigator.serviceWorker) {
+        const registrations = await navigator.serviceWorker.getRegistrations();
+        await Promise.all(registrations.map(registration => registration.unregister()));
+    }
+    if (window.caches) {
+        const keys = await caches.keys();
+        await Promise.all(keys.map(key => caches.delete(key)));
+    }
+    if (window.indexedDB && indexedDB.databases) {
+        const databases = await indexedDB.databases();
+        await Promise.all(databases.map(database => new Promise(resolve => {
+            const request = indexedDB.deleteDatabase(database.name);
+            request.onsuccess = request.onerror = request.onblocked = resolve;
+        })));
+    }
+}"""
+
+
+def url_origin(url: str):
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https"):
+        return None
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+class ContextPool:
+    def __init__(self, browser, size: int = 2, max_uses: int = 20, tracing: bool = False):
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.tracing = tracing
+        self.idle = deque()
+        self.uses = {}
+        self.origins = {}
+        self.fill()
+
+    def create(self):
+        context = self.browser.new_context()
+        if self.tracing:
+            context.tracing.start(**TRACING_OPTIONS)
+        origins = set()
+
+        def track_origin(request):
+            if request.is_navigation_request():
+                origins.add(url_origin(request.url))
+
+        context.on("request", track_origin)
+        self.uses[context] = 0
+        self.origins[context] = origins
+        return context, context.new_page()
+
+    def fill(self):
+        while len(self.idle) < self.size:
+            self.idle.append(self.create())
+
+    def acquire(self):
+        if not self.idle:
+            self.fill()
+        context, page = self.idle.popleft()
+        self.uses[context] += 1
+        return context, page
+
+    def release(self, context, page):
+        if self.uses[context] >= self.max_uses or page.is_closed():
+            self.discard(context)
+        else:
+            try:
+                self.idle.append((context, self.reset(context)))
+            except Error:
+                self.discard(context)
+        self.fill()
+
+    def reset(self, context):
+        # a fresh page drops whatever listeners, routes and viewport the test left on the old one
+        fresh = context.new_page()
+        for other in context.pages:
+            if other != fresh:
+                other.close()
+        context.clear_cookies()
+        context.clear_permissions()
+        origins = self.origins[context]
+        origins.discard(None)
+        if self.browser.browser_type.name == "chromium":
+            session = context.new_cdp_session(fresh)
+            for origin in origins:
+                session.send("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            session.detach()
+        else:
+            for origin in list(origins):
+                self.clear_origin_storage(fresh, origin)
+            fresh.goto("about:blank")
+        origins.clear()
+        return fresh
+
+    @staticmethod
+    def clear_origin_storage(page, origin: str):
+        blank_document = f"{origin}/__context_pool_reset__"
+        page.route(blank_document, lambda route: route.fulfill(status=200, content_type="text/html", body=""))
+        try:
+            page.goto(blank_document)
+            page.evaluate(CLEAR_STORAGE_SCRIPT)
+        finally:
+            page.unroute(blank_document)
+
+    def discard(self, context):
+        self.uses.pop(context, None)
+        self.origins.pop(context, None)
+        try:
+            context.close()
+        except Error:
+            pass
+
+    def close(self):
+        while self.idle:
+            context, _ = self.idle.popleft()
+            self.discard(context)
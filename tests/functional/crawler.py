@@ -0,0 +1,131 @@
+import asyncio
+from collections import defaultdict
+from urllib.parse import quote, urldefrag, urljoin, urlparse
+
+from functional.tools.content_index import current_posts
+
+UNVERIFIABLE_STATUSES = {429, 999}
+LINKS_SCRIPT = "links => links.map(link => link.href)"
+
+
+def error_message(error: Exception) -> str:
+    return (str(error).splitlines() or [type(error).__name__])[0]
+
+
+def blog_slugs() -> list:
+    return sorted(post["slug"] for post in current_posts())
+
+
+def blog_tags() -> list:
+    return sorted({tag for post in current_posts() for tag in post.get("tags", [])})
+
+
+def page_paths() -> list:
+    return [('', "homepage"), ('about', "about page"), ('blogs', "blogs page"), (f"blogs/{blog_slugs()[0]}", "blog page")]
+
+
+def seed_paths() -> list:
+    return ["", "about", "blogs", "tags"] + [f"blogs/{slug}" for slug in blog_slugs()] + [f"tags/{quote(tag)}" for tag in blog_tags()]
+
+
+class LinkChecker:
+    def __init__(self, context, request_context, base_url: str, workers: int = 8, check_external: bool = True):
+        self.context = context
+        self.request_context = request_context
+        self.base_url = base_url
+        self.origin = urlparse(base_url).netloc
+        self.workers = workers
+        self.check_external = check_external
+        self.visited = set()
+        self.sources = defaultdict(set)
+        self.external = defaultdict(set)
+        self.broken = defaultdict(list)
+
+    def enqueue(self, queue: asyncio.Queue, url: str, source: str):
+        self.sources[url].add(source)
+        if url not in self.visited:
+            self.visited.add(url)
+            queue.put_nowait(url)
+
+    def add_link(self, queue: asyncio.Queue, href: str, source: str):
+        url, _ = urldefrag(href)
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            return
+        if parsed.netloc == self.origin:
+            self.enqueue(queue, url, source)
+        else:
+            self.external[url].add(source)
+
+    def report_broken(self, url: str, reason: str, sources):
+        for source in sources:
+            self.broken[source].append((url, reason))
+
+    async def visit(self, page, queue: asyncio.Queue, url: str):
+        try:
+            response = await page.goto(url, wait_until="domcontentloaded")
+            if response is None or response.status >= 400:
+                self.report_broken(url, f"HTTP {response.status if response else 'no response'}", self.sources[url])
+                return
+            hrefs = await page.eval_on_selector_all("a[href]", LINKS_SCRIPT)
+        except Exception as error:
+            self.report_broken(url, error_message(error), self.sources[url])
+            return
+        for href in hrefs:
+            self.add_link(queue, href, url)
+
+    async def worker(self, queue: asyncio.Queue):
+        # a worker without a page still drains the queue, otherwise queue.join() in crawl() never returns
+        page, page_error = None, None
+        try:
+            page = await self.context.new_page()
+        except Exception as error:
+            page_error = f"no page to visit with: {error_message(error)}"
+        try:
+            while True:
+                url = await queue.get()
+                try:
+                    if page is None:
+                        self.report_broken(url, page_error, self.sources[url])
+                    else:
+                        await self.visit(page, queue, url)
+                finally:
+                    queue.task_done()
+        finally:
+            if page is not None:
+                await page.close()
+
+    async def check_external_link(self, semaphore: asyncio.Semaphore, url: str):
+        async with semaphore:
+            try:
+                response = await self.request_context.head(url, fail_on_status_code=False)
+                if response.status >= 400:
+                    response = await self.request_context.get(url, fail_on_status_code=False)
+            except Exception as error:
+                self.report_broken(url, error_message(error), self.external[url])
+                return
+            if response.status >= 400 and response.status not in UNVERIFIABLE_STATUSES:
+                self.report_broken(url, f"HTTP {response.status}", self.external[url])
+
+    async def crawl(self, seeds: list) -> dict:
+        queue = asyncio.Queue()
+        for seed in seeds:
+            self.enqueue(queue, urljoin(self.base_url, seed), "(seed)")
+        workers = [asyncio.create_task(self.worker(queue)) for _ in range(self.workers)]
+        await queue.join()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        if self.check_external:
+            semaphore = asyncio.Semaphore(self.workers)
+            await asyncio.gather(*(self.check_external_link(semaphore, url) for url in self.external))
+        return {source: sorted(links) for source, links in sorted(self.broken.items())}
+
+
+def format_report(broken: dict) -> str:
+    lines = []
+    for source, links in broken.items():
+        lines.append(f"{source}:")
+        lines.extend(f"    {url} -> {reason}" for url, reason in links)
+    return "\n".join(lines)
@@ -0,0 +1,90 @@
+import functools
+import json
+import re
+import shutil
+import weakref
+
+import pytest
+from playwright.sync_api import Error
+
+UNSAFE_PATH_CHARACTERS = re.compile(r"[^\w.-]+")
+TRACING_OPTIONS = {"screenshots": True, "snapshots": True}
+phase_reports_key = pytest.StashKey[dict]()
+
+
+def item_failed(item) -> bool:
+    return any(report.failed for report in item.stash.get(phase_reports_key, {}).values())
+
+
+def artifact_name(nodeid: str) -> str:
+    return UNSAFE_PATH_CHARACTERS.sub("_", nodeid).strip("_")
+
+
+class FailureCapture:
+    def __init__(self, artifacts_dir, enabled: bool = True, max_chunks: int = 20):
+        self.artifacts_dir = artifacts_dir
+        self.enabled = enabled
+        self.max_chunks = max_chunks
+        self.chunks = weakref.WeakKeyDictionary()
+        self.failed_call = None
+        self.saved = []
+        self.patched = []
+
+    def watch(self, owner):
+        for name, original in list(vars(owner).items()):
+            if callable(original) and not name.startswith("_"):
+                setattr(owner, name, self.guard(original, f"{owner.__name__}.{name}"))
+                self.patched.append((owner, name, original))
+
+    def guard(self, original, call: str):
+        capture = self
+
+        @functools.wraps(original)
+        def guarded(page_object, *args, **kwargs):
+            try:
+                return original(page_object, *args, **kwargs)
+            except Exception:
+                if capture.failed_call is None:
+                    capture.failed_call = {"call": call, "url": page_object.page.url, "dom": page_object.page.content()}
+                raise
+
+        return guarded
+
+    def restore(self):
+        for owner, name, original in reversed(self.patched):
+            setattr(owner, name, original)
+        self.patched.clear()
+
+    def start(self, context, nodeid: str):
+        self.failed_call = None
+        if not self.enabled:
+            return
+        chunks = self.chunks.get(context, 0)
+        if chunks >= self.max_chunks:
+            # dropped chunks still leave their snapshots and resources in the buffer until tracing stops
+            context.tracing.stop()
+            context.tracing.start(**TRACING_OPTIONS)
+            chunks = 0
+        self.chunks[context] = chunks + 1
+        context.tracing.start_chunk(title=nodeid)
+
+    def finish(self, context, page, nodeid: str, failed: bool):
+        if not self.enabled:
+            return
+        if not failed:
+            context.tracing.stop_chunk()
+            return
+
+        directory = self.artifacts_dir / artifact_name(nodeid)
+        shutil.rmtree(directory, ignore_errors=True)
+        directory.mkdir(parents=True)
+        context.tracing.stop_chunk(path=directory / "trace.zip")
+        failed_call = self.failed_call or {"call": None, "url": page.url, "dom": None}
+        try:
+            page.screenshot(path=directory / "screenshot.png", full_page=True)
+            failed_call["dom"] = failed_call["dom"] or page.content()
+        except Error:
+            pass
+        (directory / "dom.html").write_text(failed_call.pop("dom") or "")
+        (directory / "failure.json").write_text(json.dumps({"nodeid": nodeid, **failed_call}, indent=2))
+        self.saved.append(directory)
@@ -0,0 +1,107 @@
+import re
+
+from functional.pages.page_types import page_type
+
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+STUBBED_URL_PATTERNS = [
+    re.compile(r"/_vercel/insights/"),
+    re.compile(r"vercel-insights\.com"),
+    re.compile(r"vercel-scripts\.com"),
+]
+CACHED_URL_PATTERNS = [
+    re.compile(r"/_next/static/"),
+]
+DROPPED_RESPONSE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class NetworkRouter:
+    def __init__(self, cache: dict, block_heavy_assets: bool = True, har=None):
+        self.cache = cache
+        self.block_heavy_assets = block_heavy_assets
+        self.har = har
+
+    def action(self, request) -> str:
+        if self.block_heavy_assets:
+            if any(pattern.search(request.url) for pattern in STUBBED_URL_PATTERNS):
+                return "stub"
+            if request.resource_type in BLOCKED_RESOURCE_TYPES:
+                return "abort"
+        if self.har is not None:
+            return self.har.mode
+        if self.cache is not None and request.method == "GET" and any(pattern.search(request.url) for pattern in CACHED_URL_PATTERNS):
+            return "cache"
+        return "continue"
+
+    @staticmethod
+    def source_page_type(request) -> str:
+        if request.is_navigation_request():
+            return page_type(request.url)
+        return page_type(request.frame.url)
+
+    @staticmethod
+    def fulfillment(response, body: bytes) -> dict:
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in DROPPED_RESPONSE_HEADERS}
+        return {"status": response.status, "headers": headers, "body": body}
+
+    def replayed(self, request):
+        entry = self.har.lookup(self.source_page_type(request), request.method, request.url)
+        return None if entry is None else self.har.response(entry)
+
+    def store(self, action: str, request, response, body: bytes) -> dict:
+        fulfillment = self.fulfillment(response, body)
+        if action == "record":
+            self.har.record(self.source_page_type(request), request.method, request.url, request.headers, **fulfillment)
+        elif response.ok:
+            self.cache[request.url] = fulfillment
+        return fulfillment
+
+    def handle(self, route):
+        request = route.request
+        action = self.action(request)
+        if action == "stub":
+            route.fulfill(status=204, body="")
+        elif action == "abort":
+            route.abort("blockedbyclient")
+        elif action == "replay":
+            fulfillment = self.replayed(request)
+            if fulfillment is None:
+                route.abort("internetdisconnected")
+            else:
+                route.fulfill(**fulfillment)
+        elif action == "cache" and request.url in self.cache:
+            route.fulfill(**self.cache[request.url])
+        elif action in ("cache", "record"):
+            response = route.fetch()
+            route.fulfill(**self.store(action, request, response, response.body()))
+        else:
+            route.continue_()
+
+    async def handle_async(self, route):
+        request = route.request
+        action = self.action(request)
+        if action == "stub":
+            await route.fulfill(status=204, body="")
+        elif action == "abort":
+            await route.abort("blockedbyclient")
+        elif action == "replay":
+            fulfillment = self.replayed(request)
+            if fulfillment is None:
+                await route.abort("internetdisconnected")
+            else:
+                await route.fulfill(**fulfillment)
+        elif action == "cache" and request.url in self.cache:
+            await route.fulfill(**self.cache[request.url])
+        elif action in ("cache", "record"):
+            response = await route.fetch()
+            await route.fulfill(**self.store(action, request, response, await response.body()))
+        else:
+            await route.continue_()
+
+
+def network_router(request, asset_cache, har_archive=None) -> NetworkRouter:
+    # performance metrics have to see the real images, fonts and chunk fetches
+    if request.config.getoption("perf_metrics"):
+        return NetworkRouter(None, block_heavy_assets=False, har=har_archive)
+    is_visual = request.node.get_closest_marker("visual") is not None
+    block_heavy_assets = not (is_visual or request.config.getoption("allow_heavy_assets"))
+    return NetworkRouter(asset_cache, block_heavy_assets=block_heavy_assets, har=har_archive)
@@ -0,0 +1,63 @@
+import logging
+import time
+
+from playwright.async_api import Page, TimeoutError
+
+from functional.pages.base import CHECK_ELEMENTS_EXIST_SCRIPT, READY_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+
+class Base:
+    visit_listeners = []
+    required_elements = {}
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def open(self, base_url):
+        await self.page.goto(f"{base_url}", wait_until="domcontentloaded")
+        await self.wait_until_ready()
+        self.visited()
+
+    def visited(self):
+        for listener in self.visit_listeners:
+            listener(self)
+
+    async def wait_until_ready(self, timeout: float = None) -> float:
+        start = time.perf_counter()
+        try:
+            await self.page.wait_for_function(READY_SCRIPT, arg=self.required_elements, timeout=timeout)
+        except TimeoutError as error:
+            missing = [name for name, exists in (await self.check_elements_exist(self.required_elements)).items() if not exists]
+            raise TimeoutError(f"{type(self).__name__} at {self.page.url} not ready, missing: {', '.join(missing) or 'hydration'}") from error
+        self.ready_after = time.perf_counter() - start
+        logger.debug("%s ready after %.3fs at %s", type(self).__name__, self.ready_after, self.page.url)
+        return self.ready_after
+
+    async def click_link(self, role: str = None, name: str = None, xpath: str = None, **kwargs) -> str:
+        selector_parts = []
+        if xpath:
+            link = await self.page.query_selector(f'xpath={xpath}')
+        else:
+            if role:
+                selector_parts.append(f'role={role}')
+            if name:
+                selector_parts.append(f'text={name}')
+            for key, value in kwargs.items():
+                selector_parts.append(f'{key}="{value}"')
+            selector = " >> ".join(selector_parts)
+            link = await self.page.query_selector(selector)
+        async with self.page.expect_navigation():
+            await link.click()
+        return self.page.url
+
+    async def check_element_exists(self, role: str = None, name: str = None, xpath: str = None) -> bool:
+        if xpath:
+            element = await self.page.query_selector(f'xpath={xpath}')
+        else:
+            element = await self.page.query_selector(f'role={role} >> text={name}')
+        return element is not None
+
+    async def check_elements_exist(self, xpaths: dict) -> dict:
+        return await self.page.evaluate(CHECK_ELEMENTS_EXIST_SCRIPT, xpaths)
@@ -0,0 +1,44 @@
+from playwright.async_api import Page
+
+from functional.pages.aio.base import Base
+from functional.pages import elements
+
+
+class BlogCategories(Base):
+    required_elements = {
+        "blog posts categories button": elements.HOMEPAGE_BLOG_POSTS_CATEGORIES_BUTTON_XPATH,
+    }
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def open(self, base_url):
+        await super().open(base_url)
+        categories_button = await self.page.query_selector(f"xpath={elements.HOMEPAGE_BLOG_POSTS_CATEGORIES_BUTTON_XPATH}")
+        await categories_button.click()
+        await self.page.wait_for_url("**/tags")
+
+    async def get_main_text(self):
+        main_header = await self.page.query_selector("text=All Tag Categories of Blog Posts")
+        if main_header is None:
+            return None
+        return await main_header.inner_text()
+
+    async def get_all_tags(self):
+        tag_elements = await self.page.query_selector_all('a.border.border-gray-200.rounded-lg')
+        return [{'name': (await tag.inner_text()).split("\n")[0], 'href': await tag.get_attribute('href')} for tag in tag_elements]
+
+    async def navigate_to_python_tag(self, xpath: str) -> None:
+        parent_element = await self.page.query_selector(f'xpath={xpath}')
+        await parent_element.click()
+        assert await self.page.query_selector("text=All Blog Posts in the Python Category") is not None
+        return self.page.url
+
+    async def navigate_to_first_article_in_python_tag(self, xpath: str) -> bool:
+        first_article = await self.page.query_selector(f'xpath={xpath}')
+        await first_article.click()
+        python_tag = await self.page.wait_for_selector('a[href="/tags/Python"]')
+        if await python_tag.is_visible():
+            return True
+        else:
+            return False
@@ -0,0 +1,26 @@
+from playwright.async_api import Page
+
+from functional.pages.aio.base import Base
+from functional.pages import elements
+
+
+class Footer(Base):
+    required_elements = {
+        "about me link": elements.FOOTER_ABOUT_ME_LINK_XPATH,
+        "copyrights year": elements.FOOTER_CR_YEAR_XPATH,
+    }
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def open(self, base_url):
+        await super().open(base_url)
+
+    async def get_year_cr_text(self, xpath: str) -> str:
+        element = await self.page.query_selector(f'xpath={xpath}')
+        if element is None:
+            return None
+        element_text = await element.inner_text()
+        parts = element_text.split()
+        year = int([part for part in parts if part.isdigit()][0])
+        return year
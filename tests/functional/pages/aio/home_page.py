@@ -0,0 +1,45 @@
+from playwright.async_api import Page
+
+from functional.pages.aio.base import Base
+from functional.pages import elements
+
+
+class HomePage(Base):
+    required_elements = {
+        "all blog posts button": elements.HOMEPAGE_ALL_BLOG_POSTS_BUTTON_XPATH,
+        "blog posts categories button": elements.HOMEPAGE_BLOG_POSTS_CATEGORIES_BUTTON_XPATH,
+        "blogs div": elements.HOMEPAGE_BLOGS_DIV_ELE_XPATH,
+    }
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def open(self, base_url):
+        await super().open(base_url)
+
+    async def get_main_header_text(self):
+        main_header = await self.page.query_selector("text=Welcome to")
+        if main_header is None:
+            return None
+        return await main_header.inner_text()
+
+    async def get_main_header_text2(self):
+        main_header2 = await self.page.query_selector("text=Kazi's Dev Blog")
+        if main_header2 is None:
+            return None
+        text = await main_header2.inner_text()
+        cleaned_text = text.replace('\xa0', ' ').strip()
+        return cleaned_text
+
+    async def get_newest_blogs_text(self):
+        main_header = await self.page.query_selector("text=Newest Blog Posts")
+        if main_header is None:
+            return None
+        return await main_header.inner_text()
+
+    async def get_child_div_count(self, xpath: str) -> int:
+        parent_element = await self.page.query_selector(f'xpath={xpath}')
+        if parent_element is None:
+            return 0
+        child_divs = await parent_element.query_selector_all("div.group")
+        return len(child_divs)
@@ -0,0 +1,28 @@
+from playwright.async_api import Page
+
+from functional.pages.aio.base import Base
+from functional.pages import elements
+from functional.pages.navbar import SEARCH_BOX
+
+
+class NavBar(Base):
+    required_elements = {
+        "home link": elements.NAVBAR_HOME_LINK_XPATH,
+        "search input": elements.NAVBAR_SEARCH_LINK_XPATH,
+    }
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def open(self, base_url):
+        await super().open(base_url)
+
+    async def search(self, query: str):
+        await self.page.locator(SEARCH_BOX).fill(query)
+        await self.page.locator(f"xpath={elements.NAVBAR_SEARCH_BOX_RESULTS_XPATH}").wait_for()
+
+    async def open_first_search_result(self) -> str:
+        async with self.page.expect_navigation():
+            await self.page.keyboard.down("ArrowDown")
+            await self.page.keyboard.press("Enter")
+        return self.page.url
@@ -1,17 +1,73 @@
-from playwright.sync_api import Page
+import logging
+import time
+
+from playwright.sync_api import Page, TimeoutError
+
+from functional.pages.locators import locators_for
+
+logger = logging.getLogger(__name__)
+
+CHECK_ELEMENTS_EXIST_SCRIPT = """xpaths => Object.fromEntries(Object.entries(xpaths).map(([name, xpath]) => [
+    name,
+    document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null
+]))"""
+
+READY_SCRIPT = """xpaths => {
+    const hydrated = window.next
+        ? performance.getEntriesByName("Next.js-hydration", "measure").length > 0
+        : document.readyState === "complete";
+    return hydrated && Object.values(xpaths).every(xpath =>
+        document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null
+    );
+}"""
 
 
 class Base:
+    open_listeners = []
+    visit_listeners = []
+    required_elements = {}
+
     def __init__(self, page: Page):
         self.page = page
 
     def open(self, base_url):
-        self.page.goto(f"{base_url}")
+        self.page.goto(f"{base_url}", wait_until="domcontentloaded")
+        self.wait_until_ready()
+        self.locators.validate()
+        for listener in self.open_listeners:
+            listener(self)
+        self.visited()
+
+    @property
+    def locators(self):
+        return locators_for(self.page)
+
+    def element(self, xpath: str):
+        return self.locators.get(xpath)
+
+    def visited(self):
+        for listener in self.visit_listeners:
+            listener(self)
+
+    def wait_until_ready(self, timeout: float = None) -> float:
+        start = time.perf_counter()
+        try:
+            self.page.wait_for_function(READY_SCRIPT, arg=self.required_elements, timeout=timeout)
+        except TimeoutError as error:
+            missing = [name for name, exists in self.check_elements_exist(self.required_elements).items() if not exists]
+            raise TimeoutError(f"{type(self).__name__} at {self.page.url} not ready, missing: {', '.join(missing) or 'hydration'}") from error
+        self.ready_after = time.perf_counter() - start
+        logger.debug("%s ready after %.3fs at %s", type(self).__name__, self.ready_after, self.page.url)
+        return self.ready_after
+
+    def screenshot(self) -> bytes:
+        self.page.wait_for_load_state("load")
+        return self.page.screenshot(full_page=True, animations="disabled", caret="hide")
 
     def click_link(self, role: str = None, name: str = None, xpath: str = None, **kwargs) -> str:
         selector_parts = []
         if xpath:
-            link = self.page.query_selector(f'xpath={xpath}')
+            link = self.element(xpath)
         else:
             if role:
                 selector_parts.append(f'role={role}')
@@ -31,3 +87,6 @@ class Base:
         else:
             element = self.page.query_selector(f'role={role} >> text={name}')
         return element is not None
+
+    def check_elements_exist(self, xpaths: dict) -> dict:
+        return self.page.evaluate(CHECK_ELEMENTS_EXIST_SCRIPT, xpaths)
@@ -5,12 +5,17 @@ from functional.pages import elements
 
 
 class BlogCategories(Base):
+    required_elements = {
+        "blog posts categories button": elements.HOMEPAGE_BLOG_POSTS_CATEGORIES_BUTTON_XPATH,
+    }
+
     def __init__(self, page: Page):
         self.page = page
 
     def open(self, base_url):
-        self.page.goto(f"{base_url}")
-        self.page.query_selector(f"xpath={elements.HOMEPAGE_BLOG_POSTS_CATEGORIES_BUTTON_XPATH}").click()
+        super().open(base_url)
+        self.element(elements.HOMEPAGE_BLOG_POSTS_CATEGORIES_BUTTON_XPATH).click()
+        self.page.wait_for_url("**/tags")
 
     def get_main_text(self):
         main_header = self.page.query_selector("text=All Tag Categories of Blog Posts")
@@ -23,13 +28,13 @@ class BlogCategories(Base):
         return [{'name': tag.inner_text().split("\n")[0], 'href': tag.get_attribute('href')} for tag in tag_elements]
 
     def navigate_to_python_tag(self, xpath: str) -> None:
-        parent_element = self.page.query_selector(f'xpath={xpath}')
+        parent_element = self.element(xpath)
         parent_element.click()
         assert self.page.query_selector("text=All Blog Posts in the Python Category") is not None
         return self.page.url
 
     def navigate_to_first_article_in_python_tag(self, xpath: str) -> bool:
-        first_article = self.page.query_selector(f'xpath={xpath}')
+        first_article = self.element(xpath)
         first_article.click()
         if self.page.wait_for_selector('a[href="/tags/Python"]').is_visible():
             return True
@@ -1,9 +1,16 @@
-NAVBAR_HOME_LINK_XPATH = '//*[@id="__next"]/div/div[1]/div[1]/div/div/nav/div[2]/a[3]'
-NAVBAR_BLOG_POSTS_LINK_XPATH = '//*[@id="__next"]/div/div[1]/div[1]/div/div/nav/div[2]/a[2]'
-NAVBAR_ABOUT_ME_LINK_XPATH = '//*[@id="__next"]/div/div[1]/div[1]/div/div/nav/div[2]/a[1]'
-NAVBAR_LOGO_LINK_XPATH = '//*[@id="__next"]/div/div[1]/div[1]/div/div/nav/div[1]/div/a'
+NAVBAR_HOME_LINK_XPATH = '//nav[@aria-label="Global"]/div[2]/a[3]'
+NAVBAR_BLOG_POSTS_LINK_XPATH = '//nav[@aria-label="Global"]/div[2]/a[2]'
+NAVBAR_ABOUT_ME_LINK_XPATH = '//nav[@aria-label="Global"]/div[2]/a[1]'
+NAVBAR_LOGO_LINK_XPATH = '//nav[@aria-label="Global"]/div[1]/div/a'
 NAVBAR_SEARCH_LINK_XPATH = '//*[@id="search-input"]'
-NAVBAR_SEARCH_BOX_RESULTS_XPATH = '//*[@id="__next"]/div/div[1]/div[1]/div/div/nav/div[3]/ul'
+NAVBAR_SEARCH_BOX_RESULTS_XPATH = '//nav[@aria-label="Global"]/div[3]/ul'
+NAVBAR_ELEMENTS = {
+    "home link": NAVBAR_HOME_LINK_XPATH,
+    "blog posts link": NAVBAR_BLOG_POSTS_LINK_XPATH,
+    "about me link": NAVBAR_ABOUT_ME_LINK_XPATH,
+    "logo link": NAVBAR_LOGO_LINK_XPATH,
+    "search input": NAVBAR_SEARCH_LINK_XPATH,
+}
 
 HOMEPAGE_MAIN_PIC_XPATH = '//*[@id="__next"]/div/div[1]/div[2]/span/img'
 HOMEPAGE_ALL_BLOG_POSTS_BUTTON_XPATH = '//*[@id="__next"]/div/div[1]/div[1]/main/div/div/div[1]/a'
@@ -12,6 +19,15 @@ HOMEPAGE_SEE_ALL_LINK_XPATH = '//*[@id="__next"]/div/div[2]/h2/a'
 HOMEPAGE_BLOGS_DIV_ELE_XPATH = '//*[@id="__next"]/div/div[2]/div'
 HOMEPAGE_EXPLORE_MORE_BLOGS_XPATH = '//*[@id="__next"]/div/div[2]/div[2]/h2'
 HOMEPAGE_DISCOVER_ARTICLES_BUTTON_XPATH = '//*[@id="__next"]/div/div[2]/div[2]/a'
+HOMEPAGE_ELEMENTS = {
+    "main picture": HOMEPAGE_MAIN_PIC_XPATH,
+    "all blog posts button": HOMEPAGE_ALL_BLOG_POSTS_BUTTON_XPATH,
+    "blog posts categories button": HOMEPAGE_BLOG_POSTS_CATEGORIES_BUTTON_XPATH,
+    "see all link": HOMEPAGE_SEE_ALL_LINK_XPATH,
+    "blogs div": HOMEPAGE_BLOGS_DIV_ELE_XPATH,
+    "explore more blogs header": HOMEPAGE_EXPLORE_MORE_BLOGS_XPATH,
+    "discover articles button": HOMEPAGE_DISCOVER_ARTICLES_BUTTON_XPATH,
+}
 
 FOOTER_ABOUT_ME_LINK_XPATH = '//*[@id="__next"]/footer/div/nav/div[1]/a'
 FOOTER_BLOG_POSTS_LINK_XPATH = '//*[@id="__next"]/footer/div/nav/div[2]/a'
@@ -22,6 +38,39 @@ FOOTER_LINKEDIN_SVG_XPATH = '//*[@id="__next"]/footer/div/div/a[1]'
 FOOTER_TWITTER_SVG_XPATH = '//*[@id="__next"]/footer/div/div/a[2]'
 FOOTER_GITHUB_SVG_XPATH = '//*[@id="__next"]/footer/div/div/a[3]'
 FOOTER_ISRAEL_FLAG_SVG_XPATH = '//*[@id="SVGRepo_iconCarrier"]/path[2]'
+FOOTER_ELEMENTS = {
+    "about me link": FOOTER_ABOUT_ME_LINK_XPATH,
+    "blog posts link": FOOTER_BLOG_POSTS_LINK_XPATH,
+    "home link": FOOTER_HOME_LINK_XPATH,
+    "copyrights link": FOOTER_CR_KAZI_XPATH,
+    "copyrights year": FOOTER_CR_YEAR_XPATH,
+    "linkedin svg": FOOTER_LINKEDIN_SVG_XPATH,
+    "twitter svg": FOOTER_TWITTER_SVG_XPATH,
+    "github svg": FOOTER_GITHUB_SVG_XPATH,
+    "israel flag svg": FOOTER_ISRAEL_FLAG_SVG_XPATH,
+}
 
 BLOGS_CATEGORIES_PYTHON_TAG = '//*[@id="__next"]/div/div[2]/div/div[1]/div/a[1]'
 BLOGS_CATEGORIES_FIRST_ARTICLE_XPATH = '//*[@id="__next"]/div/div[2]/div/div[1]/div[1]/a/div/span/img'
+TAGS_ELEMENTS = {
+    "python tag": BLOGS_CATEGORIES_PYTHON_TAG,
+}
+TAG_ELEMENTS = {
+    "first article image": BLOGS_CATEGORIES_FIRST_ARTICLE_XPATH,
+}
+
+LOCATOR_GROUPS = {
+    "navbar": NAVBAR_ELEMENTS,
+    "footer": FOOTER_ELEMENTS,
+    "homepage": HOMEPAGE_ELEMENTS,
+    "tags": TAGS_ELEMENTS,
+    "tag": TAG_ELEMENTS,
+}
+PAGE_TYPE_GROUPS = {
+    "home": ("navbar", "homepage", "footer"),
+    "about": ("navbar", "footer"),
+    "blogs": ("navbar", "footer"),
+    "blog": ("navbar", "footer"),
+    "tags": ("navbar", "tags", "footer"),
+    "tag": ("navbar", "tag", "footer"),
+}
@@ -1,17 +1,23 @@
 from playwright.sync_api import Page
 
 from functional.pages.base import Base
+from functional.pages import elements
 
 
 class Footer(Base):
+    required_elements = {
+        "about me link": elements.FOOTER_ABOUT_ME_LINK_XPATH,
+        "copyrights year": elements.FOOTER_CR_YEAR_XPATH,
+    }
+
     def __init__(self, page: Page):
         self.page = page
 
     def open(self, base_url):
-        self.page.goto(f"{base_url}")
+        super().open(base_url)
 
     def get_year_cr_text(self, xpath: str) -> str:
-        element = self.page.query_selector(f'xpath={xpath}')
+        element = self.element(xpath)
         if element is None:
             return None
         element_text = element.inner_text()
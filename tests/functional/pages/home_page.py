@@ -1,14 +1,21 @@
 from playwright.sync_api import Page
 
 from functional.pages.base import Base
+from functional.pages import elements
 
 
 class HomePage(Base):
+    required_elements = {
+        "all blog posts button": elements.HOMEPAGE_ALL_BLOG_POSTS_BUTTON_XPATH,
+        "blog posts categories button": elements.HOMEPAGE_BLOG_POSTS_CATEGORIES_BUTTON_XPATH,
+        "blogs div": elements.HOMEPAGE_BLOGS_DIV_ELE_XPATH,
+    }
+
     def __init__(self, page: Page):
         self.page = page
 
     def open(self, base_url):
-        self.page.goto(f"{base_url}")
+        super().open(base_url)
 
     def get_main_header_text(self):
         main_header = self.page.query_selector("text=Welcome to")
@@ -31,7 +38,7 @@ class HomePage(Base):
         return main_header.inner_text()
 
     def get_child_div_count(self, xpath: str) -> int:
-        parent_element = self.page.query_selector(f'xpath={xpath}')
+        parent_element = self.element(xpath)
         if parent_element is None:
             return 0
         child_divs = parent_element.query_selector_all("div.group")
@@ -0,0 +1,80 @@
+from playwright.sync_api import Page
+
+from functional.pages.elements import LOCATOR_GROUPS, PAGE_TYPE_GROUPS
+from functional.pages.page_types import page_type
+
+SLOW_LOCATOR_MS = 5.0
+RESOLVE_SCRIPT = """groups => {
+    const handles = {};
+    const stats = {};
+    for (const [group, xpaths] of Object.entries(groups)) {
+        for (const [name, xpath] of Object.entries(xpaths)) {
+            const started = performance.now();
+            const matches = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            stats[xpath] = {group, name, matches: matches.snapshotLength, ms: performance.now() - started};
+            if (matches.snapshotLength) {
+                handles[xpath] = matches.snapshotItem(0);
+            }
+        }
+    }
+    return {handles, stats};
+}"""
+
+
+class LocatorError(Exception):
+    pass
+
+
+class LocatorRegistry:
+    findings = {}
+    slow_ms = SLOW_LOCATOR_MS
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.handles = None
+        self.stats = {}
+        page.on("framenavigated", self.invalidate)
+
+    def invalidate(self, frame):
+        if frame == self.page.main_frame:
+            self.handles = None
+
+    def resolve(self) -> dict:
+        current_type = page_type(self.page.url)
+        groups = {group: LOCATOR_GROUPS[group] for group in PAGE_TYPE_GROUPS.get(current_type, ())}
+        result = self.page.evaluate_handle(RESOLVE_SCRIPT, groups)
+        self.stats = result.get_property("stats").json_value()
+        self.handles = {xpath: handle.as_element() for xpath, handle in result.get_property("handles").get_properties().items()}
+        result.dispose()
+
+        for xpath, entry in self.stats.items():
+            issue = "missing" if not entry["matches"] else "ambiguous" if entry["matches"] > 1 else "slow" if entry["ms"] > self.slow_ms else None
+            if issue:
+                self.findings[f"{current_type}: {entry['group']} {entry['name']}"] = {"issue": issue, "xpath": xpath, "url": self.page.url, **entry}
+        return self.handles
+
+    def validate(self):
+        if self.handles is None:
+            self.resolve()
+        missing = [f"{entry['group']} {entry['name']} ({xpath})" for xpath, entry in self.stats.items() if not entry["matches"]]
+        if missing:
+            raise LocatorError(f"{len(missing)} locators did not resolve at {self.page.url}: {', '.join(missing)}")
+
+    def get(self, xpath: str):
+        if self.handles is None:
+            self.resolve()
+        if xpath not in self.stats:
+            return self.page.query_selector(f"xpath={xpath}")
+        if xpath not in self.handles:
+            self.resolve()
+        return self.handles.get(xpath)
+
+
+registries = {}
+
+
+def locators_for(page: Page) -> LocatorRegistry:
+    if page not in registries:
+        registries[page] = LocatorRegistry(page)
+        page.on("close", lambda closed: registries.pop(closed, None))
+    return registries[page]
@@ -1,12 +1,49 @@
+from collections import defaultdict
+
 from playwright.sync_api import Page
 
 from functional.pages.base import Base
+from functional.pages import elements
+
+
+SEARCH_BOX = '[placeholder="Search"]'
+SEARCH_LATENCY_SCRIPT = """selector => {
+    const input = document.querySelector(selector);
+    let keydownAt = null;
+    window.__searchLatencies = [];
+    input.addEventListener("keydown", event => { keydownAt = event.timeStamp; }, true);
+    document.addEventListener("input", () => {
+        const startedAt = keydownAt;
+        keydownAt = null;
+        if (startedAt === null) {
+            return;
+        }
+        requestAnimationFrame(() => setTimeout(() => window.__searchLatencies.push(performance.now() - startedAt), 0));
+    });
+}"""
 
 
 class NavBar(Base):
+    required_elements = {
+        "home link": elements.NAVBAR_HOME_LINK_XPATH,
+        "search input": elements.NAVBAR_SEARCH_LINK_XPATH,
+    }
+
     def __init__(self, page: Page):
         self.page = page
 
     def open(self, base_url):
-        self.page.goto(f"{base_url}")
-        self.page.wait_for_load_state("networkidle")
+        super().open(base_url)
+
+    def measure_search_latency(self, queries: list) -> dict:
+        search_box = self.page.locator(SEARCH_BOX)
+        self.page.evaluate(SEARCH_LATENCY_SCRIPT, SEARCH_BOX)
+        latencies = defaultdict(list)
+        for query in queries:
+            search_box.fill("")
+            self.page.evaluate("window.__searchLatencies = []")
+            search_box.type(query)
+            self.page.wait_for_function("count => window.__searchLatencies.length >= count", arg=len(query))
+            for length, latency in enumerate(self.page.evaluate("window.__searchLatencies"), start=1):
+                latencies[length].append(latency)
+        return dict(latencies)
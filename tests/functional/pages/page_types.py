@@ -0,0 +1,19 @@
+import re
+from urllib.parse import urlparse
+
+PAGE_TYPES = [
+    ("home", re.compile(r"^/?$")),
+    ("about", re.compile(r"^/about/?$")),
+    ("blogs", re.compile(r"^/blogs/?$")),
+    ("blog", re.compile(r"^/blogs/[^/]+/?$")),
+    ("tags", re.compile(r"^/tags/?$")),
+    ("tag", re.compile(r"^/tags/[^/]+/?$")),
+]
+
+
+def page_type(url: str) -> str:
+    path = urlparse(url).path
+    for name, pattern in PAGE_TYPES:
+        if pattern.match(path):
+            return name
+    return "other"
@@ -0,0 +1,8 @@
+import os
+from pathlib import Path
+
+FUNCTIONAL_DIR = Path(__file__).parent
+REPO_DIR = FUNCTIONAL_DIR.parents[1]
+REPORTS_DIR = FUNCTIONAL_DIR / "reports"
+# lets the suite follow a generated content set, see tools/synthetic_content.py
+CONTENT_DIR = Path(os.environ.get("FUNCTIONAL_CONTENT_DIR", REPO_DIR / "content"))
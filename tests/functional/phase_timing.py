@@ -0,0 +1,104 @@
+import argparse
+import functools
+import json
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from functional.stats import summarize
+
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+COMPARED_PERCENTILES = ("p50", "p95")
+
+
+def histogram(durations_ms) -> dict:
+    buckets = defaultdict(int)
+    for duration in durations_ms:
+        bucket = next((f"<={limit}ms" for limit in HISTOGRAM_BUCKETS_MS if duration <= limit), f">{HISTOGRAM_BUCKETS_MS[-1]}ms")
+        buckets[bucket] += 1
+    return dict(buckets)
+
+
+class PhaseRecorder:
+    def __init__(self):
+        self.current_test = None
+        self.samples = []
+        self.patched = []
+
+    def record(self, phase: str, seconds: float):
+        self.samples.append([self.current_test, phase, seconds])
+
+    def wrap(self, owner, name: str, phase: str):
+        original = owner.__dict__[name]
+        recorder = self
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                recorder.record(phase, time.perf_counter() - start)
+
+        setattr(owner, name, timed)
+        self.patched.append((owner, name, original))
+
+    def wrap_methods(self, owner):
+        for name, attribute in list(vars(owner).items()):
+            if callable(attribute) and not name.startswith("_"):
+                self.wrap(owner, name, f"{owner.__name__}.{name}")
+
+    def restore(self):
+        for owner, name, original in reversed(self.patched):
+            setattr(owner, name, original)
+        self.patched.clear()
+
+    def report(self) -> dict:
+        phases = defaultdict(list)
+        tests = defaultdict(lambda: defaultdict(float))
+        for nodeid, phase, seconds in self.samples:
+            phases[phase].append(seconds * 1000)
+            tests[nodeid or "(session)"][phase] += seconds * 1000
+        return {
+            "phases": {
+                phase: {**summarize(durations), "total": sum(durations), "histogram": histogram(durations)}
+                for phase, durations in sorted(phases.items())
+            },
+            "tests": {nodeid: dict(sorted(totals.items())) for nodeid, totals in sorted(tests.items())},
+        }
+
+
+def compare(baseline: dict, current: dict, threshold: float, min_delta_ms: float) -> list:
+    rows = []
+    for phase in sorted(set(baseline["phases"]) | set(current["phases"])):
+        before, after = baseline["phases"].get(phase), current["phases"].get(phase)
+        if before is None or after is None:
+            rows.append((phase, "only in " + ("current" if before is None else "baseline"), False))
+            continue
+        for key in COMPARED_PERCENTILES:
+            delta = after[key] - before[key]
+            regressed = after[key] > before[key] * threshold and delta > min_delta_ms
+            rows.append((phase, f"{key} {before[key]:.1f}ms -> {after[key]:.1f}ms ({delta:+.1f}ms)", regressed))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="diff two phase timing reports written with --phase-timing")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compare_parser = subparsers.add_parser("compare", help="flag phases that got slower between two runs")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=1.2, help="ratio above which a percentile counts as regressed")
+    compare_parser.add_argument("--min-delta-ms", type=float, default=5.0, help="ignore regressions smaller than this")
+    args = parser.parse_args(argv)
+
+    rows = compare(json.loads(args.baseline.read_text()), json.loads(args.current.read_text()), args.threshold, args.min_delta_ms)
+    width = max((len(phase) for phase, _, _ in rows), default=0)
+    for phase, change, regressed in rows:
+        print(f"{'REGRESSED' if regressed else '         '}  {phase:<{width}}  {change}")
+    return 1 if any(regressed for _, _, regressed in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
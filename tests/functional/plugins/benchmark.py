@@ -0,0 +1,29 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="run tests marked benchmark",
+    )
+    group.addoption(
+        "--search-scales",
+        default="1",
+        help="comma separated multipliers applied to the search index in the search benchmark, e.g. 1,10,100",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: measures performance instead of behaviour, only runs with --benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="needs --benchmark to run")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip_benchmark)
@@ -0,0 +1,31 @@
+import pytest
+
+from functional.context_pool import ContextPool
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("context pool")
+    group.addoption(
+        "--context-pool-size",
+        type=int,
+        default=2,
+        help="number of warm browser contexts kept ready for sync_page",
+    )
+    group.addoption(
+        "--context-max-uses",
+        type=int,
+        default=20,
+        help="number of tests a pooled context serves before it is closed and replaced",
+    )
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, pytestconfig):
+    pool = ContextPool(
+        browser,
+        size=pytestconfig.getoption("context_pool_size"),
+        max_uses=pytestconfig.getoption("context_max_uses"),
+        tracing=pytestconfig.getoption("capture_failures"),
+    )
+    yield pool
+    pool.close()
@@ -0,0 +1,36 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("crawl")
+    group.addoption(
+        "--crawl",
+        action="store_true",
+        default=False,
+        help="run the site-wide crawler and link checker",
+    )
+    group.addoption(
+        "--crawl-workers",
+        type=int,
+        default=8,
+        help="number of pages crawled concurrently",
+    )
+    group.addoption(
+        "--crawl-skip-external",
+        action="store_true",
+        default=False,
+        help="only check links within the site",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "crawl: site-wide crawler test, only runs with --crawl")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("crawl"):
+        return
+    skip_crawl = pytest.mark.skip(reason="needs --crawl to run")
+    for item in items:
+        if item.get_closest_marker("crawl"):
+            item.add_marker(skip_crawl)
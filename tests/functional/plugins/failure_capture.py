@@ -0,0 +1,99 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from functional.failure_capture import FailureCapture, phase_reports_key
+from functional.pages.base import Base
+from functional.pages.blogs_categories import BlogCategories
+from functional.pages.footer import Footer
+from functional.pages.home_page import HomePage
+from functional.pages.navbar import NavBar
+from functional.paths import REPORTS_DIR
+
+PAGE_OBJECTS = [Base, Footer, HomePage, NavBar, BlogCategories]
+TMPFS_DIR = Path("/dev/shm")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("failure capture")
+    group.addoption(
+        "--capture-failures",
+        action="store_true",
+        default=False,
+        help="trace every sync_page test and keep the trace, a screenshot and the DOM only for failing tests",
+    )
+    group.addoption(
+        "--failure-artifacts-dir",
+        default=str(REPORTS_DIR / "failures"),
+        help="directory failing tests' artifacts are written to",
+    )
+    group.addoption(
+        "--trace-buffer-dir",
+        default=str(TMPFS_DIR if TMPFS_DIR.is_dir() else tempfile.gettempdir()),
+        help="directory the browser buffers trace data in until a test's chunk is kept or dropped, tmpfs by default",
+    )
+    group.addoption(
+        "--trace-buffer-chunks",
+        type=int,
+        default=20,
+        help="number of tests a context traces before tracing is restarted and its buffered trace data is dropped",
+    )
+
+
+# wrap the page objects after phase_timing and restore them before it, so the wrappers come off in reverse order
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    capture = FailureCapture(
+        Path(config.getoption("failure_artifacts_dir")),
+        enabled=config.getoption("capture_failures"),
+        max_chunks=config.getoption("trace_buffer_chunks"),
+    )
+    if capture.enabled:
+        for page_object in PAGE_OBJECTS:
+            capture.watch(page_object)
+    config._failure_capture = capture
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_unconfigure(config):
+    config._failure_capture.restore()
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    item.stash.setdefault(phase_reports_key, {})[report.when] = report
+
+
+@pytest.fixture(scope="session")
+def launch_options(pytestconfig):
+    if not pytestconfig.getoption("capture_failures"):
+        return {}
+    return {"traces_dir": pytestconfig.getoption("trace_buffer_dir")}
+
+
+@pytest.fixture(scope="session")
+def failure_capture(pytestconfig):
+    return pytestconfig._failure_capture
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    node.config._failure_capture.saved.extend(Path(directory) for directory in node.workeroutput.get("failure_artifacts", []))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        config.workeroutput["failure_artifacts"] = [str(directory) for directory in config._failure_capture.saved]
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    capture = getattr(config, "_failure_capture", None)
+    if capture is None or not capture.saved:
+        return
+    terminalreporter.section("failure artifacts")
+    for directory in capture.saved:
+        terminalreporter.write_line(str(directory))
@@ -0,0 +1,210 @@
+import base64
+import json
+import shutil
+from datetime import datetime, timezone
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import parse_qsl, urlparse
+
+import pytest
+
+from functional.paths import FUNCTIONAL_DIR
+
+HAR_DIR = FUNCTIONAL_DIR / "har"
+HAR_MODES = ("off", "record", "replay")
+WORKER_PARTS_DIR = ".workers"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("har")
+    group.addoption(
+        "--har-mode",
+        choices=HAR_MODES,
+        default="off",
+        help="record every response into per-page-type HAR archives, or replay them with no network access",
+    )
+    group.addoption(
+        "--har-dir",
+        default=str(HAR_DIR),
+        help="directory holding the <page type>.har archives",
+    )
+    group.addoption(
+        "--har-max-age",
+        type=int,
+        default=30,
+        help="number of days after which a replayed archive is reported as stale",
+    )
+
+
+def name_values(pairs) -> list:
+    return [{"name": name, "value": value} for name, value in pairs]
+
+
+def status_text(status: int) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return ""
+
+
+def relative_url(url: str, origin: str = None) -> str:
+    # the local server picks a free port on every run, so its origin is not part of the archive key
+    if origin and url.startswith(origin):
+        return "/" + url[len(origin):]
+    return url
+
+
+def read_archives(directory: Path) -> dict:
+    archives = {}
+    for path in sorted(directory.glob("*.har")):
+        log = json.loads(path.read_text())["log"]
+        origin = log.get("_origin")
+        archives[path.stem] = {(entry["request"]["method"], relative_url(entry["request"]["url"], origin)): entry for entry in log["entries"]}
+    return archives
+
+
+def write_archives(directory: Path, archives: dict, origin: str):
+    directory.mkdir(parents=True, exist_ok=True)
+    for page_type, entries in archives.items():
+        har = {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "functional-tests", "version": "0.1.0"},
+                "entries": list(entries.values()),
+                "_origin": origin,
+            }
+        }
+        (directory / f"{page_type}.har").write_text(json.dumps(har, indent=1))
+
+
+class HarArchive:
+    def __init__(self, directory, mode: str, max_age_days: int = 30, origin: str = None):
+        self.directory = Path(directory)
+        self.origin = origin
+        self.mode = mode
+        self.max_age_days = max_age_days
+        self.archives = {}
+        self.recorded_at = {}
+        self.missing = []
+        if mode == "replay":
+            self.load()
+
+    def load(self):
+        if not self.directory.is_dir():
+            raise pytest.UsageError(f"HAR replay needs recorded archives, but {self.directory} does not exist; run with --har-mode=record first")
+        self.archives = read_archives(self.directory)
+        for page_type, entries in self.archives.items():
+            if entries:
+                self.recorded_at[page_type] = min(datetime.fromisoformat(entry["startedDateTime"]) for entry in entries.values())
+
+    def relative(self, url: str) -> str:
+        return relative_url(url, self.origin)
+
+    def lookup(self, page_type: str, method: str, url: str):
+        key = (method, self.relative(url))
+        if key in self.archives.get(page_type, {}):
+            return self.archives[page_type][key]
+        for entries in self.archives.values():
+            if key in entries:
+                return entries[key]
+        self.missing.append((page_type, method, key[1]))
+        return None
+
+    def record(self, page_type: str, method: str, url: str, request_headers: dict, status: int, headers: dict, body: bytes):
+        self.archives.setdefault(page_type, {})[(method, self.relative(url))] = {
+            "startedDateTime": datetime.now(timezone.utc).isoformat(),
+            "time": 0,
+            "request": {
+                "method": method,
+                "url": url,
+                "httpVersion": "HTTP/1.1",
+                "cookies": [],
+                "headers": name_values(request_headers.items()),
+                "queryString": name_values(parse_qsl(urlparse(url).query, keep_blank_values=True)),
+                "headersSize": -1,
+                "bodySize": -1,
+            },
+            "response": {
+                "status": status,
+                "statusText": status_text(status),
+                "httpVersion": "HTTP/1.1",
+                "cookies": [],
+                "headers": name_values(headers.items()),
+                "content": {
+                    "size": len(body),
+                    "mimeType": headers.get("content-type", ""),
+                    "text": base64.b64encode(body).decode(),
+                    "encoding": "base64",
+                },
+                "redirectURL": headers.get("location", ""),
+                "headersSize": -1,
+                "bodySize": len(body),
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": 0, "receive": 0},
+        }
+
+    @staticmethod
+    def response(entry) -> dict:
+        return {
+            "status": entry["response"]["status"],
+            "headers": {header["name"]: header["value"] for header in entry["response"]["headers"]},
+            "body": base64.b64decode(entry["response"]["content"]["text"]),
+        }
+
+    def stale(self) -> list:
+        now = datetime.now(timezone.utc)
+        return [
+            (page_type, (now - recorded_at).days)
+            for page_type, recorded_at in sorted(self.recorded_at.items())
+            if (now - recorded_at).days > self.max_age_days
+        ]
+
+    def save(self, worker_id: str = None):
+        # xdist workers write their own part, the controller combines them in pytest_sessionfinish
+        directory = self.directory / WORKER_PARTS_DIR / worker_id if worker_id else self.directory
+        write_archives(directory, self.archives, self.origin)
+
+
+@pytest.fixture(scope="session")
+def har_archive(pytestconfig, base_url):
+    mode = pytestconfig.getoption("har_mode")
+    if mode == "off":
+        yield None
+        return
+    archive = HarArchive(pytestconfig.getoption("har_dir"), mode, pytestconfig.getoption("har_max_age"), base_url)
+    pytestconfig._har_archive = archive
+    yield archive
+    if mode == "record":
+        archive.save(getattr(pytestconfig, "workerinput", {}).get("workerid"))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput") or config.getoption("har_mode") != "record":
+        return
+    directory = Path(config.getoption("har_dir"))
+    parts_dir = directory / WORKER_PARTS_DIR
+    if not parts_dir.is_dir():
+        return
+    archives, origin = {}, None
+    for part in sorted(parts_dir.iterdir()):
+        for page_type, entries in read_archives(part).items():
+            archives.setdefault(page_type, {}).update(entries)
+        origin = origin or next((json.loads(path.read_text())["log"].get("_origin") for path in part.glob("*.har")), None)
+    write_archives(directory, archives, origin)
+    shutil.rmtree(parts_dir)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    archive = getattr(config, "_har_archive", None)
+    if archive is None or archive.mode != "replay":
+        return
+    stale = archive.stale()
+    if not archive.missing and not stale:
+        return
+    terminalreporter.section("HAR replay")
+    for page_type, age in stale:
+        terminalreporter.write_line(f"stale archive: {page_type}.har was recorded {age} days ago (limit {archive.max_age_days})", yellow=True)
+    for page_type, method, url in sorted(set(archive.missing)):
+        terminalreporter.write_line(f"missing entry: [{page_type}] {method} {url}", red=True)
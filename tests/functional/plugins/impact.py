@@ -0,0 +1,184 @@
+import json
+import re
+import subprocess
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+
+from functional.pages.aio.base import Base as AsyncBase
+from functional.pages.base import Base
+from functional.pages.page_types import page_type
+from functional.paths import FUNCTIONAL_DIR, REPO_DIR
+from functional.sharding import SHARD_SUFFIX
+
+IMPACT_MAP_FILE = FUNCTIONAL_DIR / "impact_map.json"
+LISTING_PAGES = ["page:home", "page:blogs", "page:tags", "page:tag"]
+IGNORED_PATHS = re.compile(
+    r"^(README\.md|\.gitignore|\.github/|\.eslintrc\.json|\.flake8|jest\.config\.ts|.*\.test\.tsx?$"
+    r"|tests/functional/(impact_map\.json|\.test_durations\.json))"
+)
+SOURCE_RULES = [
+    (re.compile(r"^components/common/footer/"), ["Footer"]),
+    (re.compile(r"^components/common/navbar/|^components/search/|^lib/client/|^content/search/"), ["NavBar"]),
+    (re.compile(r"^components/common/header/|^components/layouts/base/|^pages/index\.tsx$"), ["page:home"]),
+    (re.compile(r"^components/layouts/page/"), ["page:about", "page:blogs", "page:blog", "page:tags", "page:tag"]),
+    (re.compile(r"^components/blogs/|^lib/blogs\.ts$|^lib/md\.ts$|^interfaces/"), ["page:blog"] + LISTING_PAGES),
+    (re.compile(r"^pages/about/"), ["page:about"]),
+    (re.compile(r"^pages/blogs/index\.tsx$"), ["page:blogs"]),
+    (re.compile(r"^pages/blogs/\[slug\]\.tsx$"), ["page:blog"]),
+    (re.compile(r"^pages/tags/index\.tsx$"), ["page:tags", "BlogCategories"]),
+    (re.compile(r"^pages/tags/\[tag\]\.tsx$"), ["page:tag"]),
+    (re.compile(r"^components/NotFound/|^pages/404\.tsx$"), ["page:other"]),
+    (re.compile(r"^tests/functional/pages/(aio/)?footer\.py$"), ["Footer"]),
+    (re.compile(r"^tests/functional/pages/(aio/)?navbar\.py$"), ["NavBar"]),
+    (re.compile(r"^tests/functional/pages/(aio/)?home_page\.py$"), ["HomePage"]),
+    (re.compile(r"^tests/functional/pages/(aio/)?blogs_categories\.py$"), ["BlogCategories"]),
+]
+BLOG_CONTENT = re.compile(r"^content/blogs/(?P<slug>[^/]+)\.md$")
+TEST_MODULE = re.compile(r"^tests/functional/(?P<module>test_[^/]+\.py)$")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact")
+    group.addoption(
+        "--changed-since",
+        default=None,
+        help="only run tests covering files changed since this git ref (plus tests marked smoke)",
+    )
+    group.addoption(
+        "--impact-map",
+        default=str(IMPACT_MAP_FILE),
+        help="file mapping each test to the page objects and pages it touched, updated after every run",
+    )
+
+
+def changed_files(ref: str) -> list:
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=REPO_DIR, capture_output=True, text=True, check=True).stdout.split()
+
+    merge_base = git("merge-base", ref, "HEAD")[0]
+    return sorted(set(git("diff", "--name-only", merge_base) + git("ls-files", "--others", "--exclude-standard")))
+
+
+def impacted_features(paths: list) -> tuple:
+    features, modules, unmapped = set(), set(), []
+    for path in paths:
+        if IGNORED_PATHS.match(path):
+            continue
+        if match := BLOG_CONTENT.match(path):
+            features.update([f"path:/blogs/{match['slug']}"] + LISTING_PAGES)
+        elif match := TEST_MODULE.match(path):
+            modules.add(match["module"])
+        elif rules := [names for pattern, names in SOURCE_RULES if pattern.search(path)]:
+            features.update(name for names in rules for name in names)
+        else:
+            unmapped.append(path)
+    return features, modules, unmapped
+
+
+def load_impact_map(path) -> dict:
+    try:
+        return json.loads(Path(path).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+class CoverageRecorder:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.current = None
+        self.coverage = {}
+
+    def record(self, page_object):
+        if self.current is None:
+            return
+        path = urlparse(page_object.page.url).path.rstrip("/") or "/"
+        self.coverage.setdefault(self.current, set()).update(
+            [type(page_object).__name__, f"page:{page_type(page_object.page.url)}", f"path:{path}"]
+        )
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self.current = SHARD_SUFFIX.sub("", item.nodeid)
+        self.coverage[self.current] = set()
+        yield
+        self.current = None
+
+    def save(self, coverage: dict):
+        if not coverage:
+            return
+        impact_map = load_impact_map(self.path)
+        impact_map.update({nodeid: sorted(features) for nodeid, features in coverage.items() if features})
+        self.path.write_text(json.dumps(impact_map, indent=2, sort_keys=True))
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "smoke: always runs, even when tests are selected with --changed-since")
+    if config.getoption("collectonly"):
+        return
+    recorder = CoverageRecorder(config.getoption("impact_map"))
+    config.pluginmanager.register(recorder, "impact-recorder")
+    Base.visit_listeners.append(recorder.record)
+    AsyncBase.visit_listeners.append(recorder.record)
+
+
+def pytest_unconfigure(config):
+    recorder = config.pluginmanager.get_plugin("impact-recorder")
+    if recorder is not None:
+        Base.visit_listeners.remove(recorder.record)
+        AsyncBase.visit_listeners.remove(recorder.record)
+
+
+def pytest_collection_modifyitems(config, items):
+    ref = config.getoption("changed_since")
+    if ref is None:
+        return
+    paths = changed_files(ref)
+    features, modules, unmapped = impacted_features(paths)
+    config._impact_summary = f"{len(paths)} changed files since {ref}"
+    if unmapped:
+        config._impact_summary += f", running everything because of unmapped changes: {', '.join(unmapped)}"
+        return
+
+    impact_map = load_impact_map(config.getoption("impact_map"))
+    selected, deselected = [], []
+    for item in items:
+        covered = impact_map.get(SHARD_SUFFIX.sub("", item.nodeid))
+        if (
+            item.get_closest_marker("smoke")
+            or covered is None
+            or item.path.name in modules
+            or features.intersection(covered)
+        ):
+            selected.append(item)
+        else:
+            deselected.append(item)
+    config._impact_summary += f", selected {len(selected)} of {len(items)} tests"
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    recorder = node.config.pluginmanager.get_plugin("impact-recorder")
+    if recorder is not None:
+        recorder.coverage.update({nodeid: set(features) for nodeid, features in node.workeroutput.get("impact_coverage", {}).items()})
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    recorder = config.pluginmanager.get_plugin("impact-recorder")
+    if recorder is None:
+        return
+    if hasattr(config, "workerinput"):
+        config.workeroutput["impact_coverage"] = {nodeid: sorted(features) for nodeid, features in recorder.coverage.items()}
+        return
+    recorder.save(recorder.coverage)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    summary = getattr(config, "_impact_summary", None)
+    if summary and not hasattr(config, "workerinput"):
+        terminalreporter.write_line(f"impact selection: {summary}")
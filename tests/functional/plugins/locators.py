@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from functional.pages.locators import SLOW_LOCATOR_MS, LocatorRegistry
+from functional.paths import REPORTS_DIR
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("locators")
+    group.addoption(
+        "--slow-locator-ms",
+        type=float,
+        default=SLOW_LOCATOR_MS,
+        help="report elements.py selectors whose in-page resolution takes longer than this",
+    )
+
+
+def pytest_configure(config):
+    LocatorRegistry.slow_ms = config.getoption("slow_locator_ms")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    LocatorRegistry.findings.update(node.workeroutput.get("locator_findings", {}))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        config.workeroutput["locator_findings"] = LocatorRegistry.findings
+        return
+    if LocatorRegistry.findings:
+        REPORTS_DIR.mkdir(exist_ok=True)
+        (REPORTS_DIR / "locators.json").write_text(json.dumps(LocatorRegistry.findings, indent=2, sort_keys=True))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not LocatorRegistry.findings:
+        return
+    terminalreporter.section("locator findings")
+    for name, finding in sorted(LocatorRegistry.findings.items()):
+        terminalreporter.write_line(f"{finding['issue']:<9} {name}: {finding['matches']} matches in {finding['ms']:.2f}ms {finding['xpath']}")
@@ -0,0 +1,150 @@
+import csv
+import json
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+from functional.pages.base import Base
+from functional.pages.page_types import page_type
+from functional.paths import FUNCTIONAL_DIR, REPORTS_DIR
+from functional.stats import percentile, summarize
+
+BUDGETS_FILE = FUNCTIONAL_DIR / "performance_budgets.json"
+BUDGET_PERCENTILE = 75
+METRICS = ("ttfb", "dom_content_loaded", "load", "lcp", "cls", "js_heap")
+
+METRICS_SCRIPT = """async () => {
+    const observed = type => new Promise(resolve => {
+        if (!PerformanceObserver.supportedEntryTypes.includes(type)) {
+            resolve(null);
+            return;
+        }
+        const observer = new PerformanceObserver(list => {
+            observer.disconnect();
+            resolve(list.getEntries());
+        });
+        observer.observe({type, buffered: true});
+        setTimeout(() => {
+            observer.disconnect();
+            resolve([]);
+        }, 100);
+    });
+    const [navigation] = performance.getEntriesByType("navigation");
+    const [lcpEntries, shiftEntries] = await Promise.all([observed("largest-contentful-paint"), observed("layout-shift")]);
+    return {
+        ttfb: navigation ? navigation.responseStart : null,
+        dom_content_loaded: navigation ? navigation.domContentLoadedEventEnd : null,
+        load: navigation ? navigation.loadEventEnd : null,
+        lcp: lcpEntries && lcpEntries.length ? lcpEntries[lcpEntries.length - 1].startTime : null,
+        cls: shiftEntries ? shiftEntries.filter(entry => !entry.hadRecentInput).reduce((total, entry) => total + entry.value, 0) : null,
+        js_heap: performance.memory ? performance.memory.usedJSHeapSize : null
+    };
+}"""
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("performance")
+    group.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=False,
+        help="collect web-performance metrics for pages opened through Base.open, with asset blocking and the chunk cache turned off",
+    )
+    group.addoption(
+        "--perf-budgets",
+        default=str(BUDGETS_FILE),
+        help=f"JSON file of per-page-type metric budgets, checked against the p{BUDGET_PERCENTILE} of the run",
+    )
+
+
+class PerfCollector:
+    def __init__(self):
+        self.samples = []
+
+    def collect(self, page_object):
+        url = page_object.page.url
+        page_object.page.wait_for_load_state("load")
+        metrics = page_object.page.evaluate(METRICS_SCRIPT)
+        self.samples.append({"url": url, "page_type": page_type(url), **metrics})
+
+    def by_page_type(self) -> dict:
+        grouped = defaultdict(list)
+        for sample in self.samples:
+            grouped[sample["page_type"]].append(sample)
+        return dict(sorted(grouped.items()))
+
+    def summary(self) -> dict:
+        return {
+            group: {metric: summarize(sample[metric] for sample in samples) for metric in METRICS}
+            for group, samples in self.by_page_type().items()
+        }
+
+    def budget_violations(self, budgets: dict) -> list:
+        violations = []
+        for group, samples in self.by_page_type().items():
+            for metric, limit in budgets.get(group, {}).items():
+                value = percentile([sample[metric] for sample in samples if sample[metric] is not None], BUDGET_PERCENTILE)
+                if value is not None and value > limit:
+                    violations.append(f"{group} {metric} p{BUDGET_PERCENTILE} is {value:.3f}, budget is {limit}")
+        return violations
+
+    def write_reports(self, reports_dir: Path):
+        reports_dir.mkdir(exist_ok=True)
+        report = {"summary": self.summary(), "samples": self.by_page_type()}
+        (reports_dir / "performance.json").write_text(json.dumps(report, indent=2))
+        with open(reports_dir / "performance.csv", "w", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=["page_type", "url", *METRICS])
+            writer.writeheader()
+            writer.writerows(self.samples)
+
+
+def pytest_configure(config):
+    if config.getoption("perf_metrics"):
+        config._perf_collector = PerfCollector()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def perf_metrics(pytestconfig):
+    collector = getattr(pytestconfig, "_perf_collector", None)
+    if collector is None:
+        yield None
+        return
+    Base.open_listeners.append(collector.collect)
+    yield collector
+    Base.open_listeners.remove(collector.collect)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    collector = getattr(node.config, "_perf_collector", None)
+    if collector is not None:
+        collector.samples.extend(node.workeroutput.get("perf_samples", []))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    collector = getattr(config, "_perf_collector", None)
+    if collector is None:
+        return
+    if hasattr(config, "workerinput"):
+        config.workeroutput["perf_samples"] = collector.samples
+        return
+    if not collector.samples:
+        return
+
+    collector.write_reports(REPORTS_DIR)
+    budgets_path = Path(config.getoption("perf_budgets"))
+    budgets = json.loads(budgets_path.read_text()) if budgets_path.is_file() else {}
+    config._perf_violations = collector.budget_violations(budgets)
+    if config._perf_violations:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    violations = getattr(config, "_perf_violations", None)
+    if not violations:
+        return
+    terminalreporter.section("performance budgets")
+    for violation in violations:
+        terminalreporter.write_line(violation, red=True)
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+from playwright.sync_api import Browser, BrowserContext, BrowserType, Page
+
+from functional.pages.base import Base
+from functional.pages.blogs_categories import BlogCategories
+from functional.pages.footer import Footer
+from functional.pages.home_page import HomePage
+from functional.pages.navbar import NavBar
+from functional.paths import REPORTS_DIR
+from functional.phase_timing import PhaseRecorder
+
+PLAYWRIGHT_PHASES = [
+    (BrowserType, "launch", "browser.launch"),
+    (Browser, "new_context", "browser.new_context"),
+    (BrowserContext, "new_page", "context.new_page"),
+    (BrowserContext, "close", "context.close"),
+    (Page, "goto", "page.goto"),
+    (Page, "wait_for_load_state", "page.wait_for_load_state"),
+    (Page, "wait_for_function", "page.wait_for_function"),
+    (Page, "query_selector", "page.query_selector"),
+    (Page, "query_selector_all", "page.query_selector_all"),
+    (Page, "evaluate", "page.evaluate"),
+]
+PAGE_OBJECTS = [Base, Footer, HomePage, NavBar, BlogCategories]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("phase timing")
+    group.addoption(
+        "--phase-timing",
+        action="store_true",
+        default=False,
+        help="time browser launch, contexts, navigation and page object calls and write reports/phase_timing.json",
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("phase_timing"):
+        return
+    recorder = PhaseRecorder()
+    for owner, name, phase in PLAYWRIGHT_PHASES:
+        recorder.wrap(owner, name, phase)
+    for page_object in PAGE_OBJECTS:
+        recorder.wrap_methods(page_object)
+    config._phase_recorder = recorder
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    recorder = getattr(item.config, "_phase_recorder", None)
+    if recorder is not None:
+        recorder.current_test = item.nodeid
+    yield
+    if recorder is not None:
+        recorder.current_test = None
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    recorder = getattr(node.config, "_phase_recorder", None)
+    if recorder is not None:
+        recorder.samples.extend(node.workeroutput.get("phase_samples", []))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    recorder = getattr(config, "_phase_recorder", None)
+    if recorder is None:
+        return
+    if hasattr(config, "workerinput"):
+        config.workeroutput["phase_samples"] = recorder.samples
+        return
+    if not recorder.samples:
+        return
+    REPORTS_DIR.mkdir(exist_ok=True)
+    (REPORTS_DIR / "phase_timing.json").write_text(json.dumps(recorder.report(), indent=2))
+
+
+def pytest_unconfigure(config):
+    recorder = getattr(config, "_phase_recorder", None)
+    if recorder is not None:
+        recorder.restore()
@@ -0,0 +1,20 @@
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("routing")
+    group.addoption(
+        "--allow-heavy-assets",
+        action="store_true",
+        default=False,
+        help="load images, fonts, media and analytics in every test, not only in tests marked visual",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "visual: test needs images, fonts, media and analytics to be loaded")
+
+
+@pytest.fixture(scope="session")
+def asset_cache():
+    return {}
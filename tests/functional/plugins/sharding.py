@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from functional.paths import FUNCTIONAL_DIR
+from functional.sharding import SHARD_SUFFIX, balance_shards, load_durations
+
+DURATIONS_FILE = FUNCTIONAL_DIR / ".test_durations.json"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("sharding")
+    group.addoption(
+        "--durations-path",
+        default=str(DURATIONS_FILE),
+        help="file used to record and read per-test durations for balanced sharding",
+    )
+    group.addoption(
+        "--no-balanced-shards",
+        action="store_true",
+        default=False,
+        help="keep xdist's default scheduling instead of duration-balanced shards",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    numprocesses = getattr(config.option, "numprocesses", None)
+    if numprocesses and config.option.dist == "no" and not config.getoption("no_balanced_shards"):
+        config.option.dist = "loadgroup"
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    config = node.config
+    node.workerinput["balanced_shards"] = config.option.dist == "loadgroup" and not config.getoption("no_balanced_shards")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None or not workerinput.get("balanced_shards"):
+        return
+
+    # workers re-parse the original command line, so the controller's switch to loadgroup has to be applied here too
+    config.option.loadgroup = True
+
+    durations = load_durations(config.getoption("durations_path"))
+    shards = balance_shards([item.nodeid for item in items], durations, workerinput["workercount"])
+    for item in items:
+        if item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(name=f"shard-{shards[item.nodeid]}"))
+
+
+class DurationRecorder:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.durations = {}
+
+    def pytest_runtest_logreport(self, report):
+        nodeid = SHARD_SUFFIX.sub("", report.nodeid)
+        self.durations[nodeid] = self.durations.get(nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        if not self.durations:
+            return
+        durations = load_durations(self.path)
+        durations.update({nodeid: round(duration, 3) for nodeid, duration in self.durations.items()})
+        self.path.write_text(json.dumps(durations, indent=2, sort_keys=True))
+
+
+def pytest_configure(config):
+    if hasattr(config, "workerinput") or config.getoption("collectonly"):
+        return
+    config.pluginmanager.register(DurationRecorder(config.getoption("durations_path")), "duration-recorder")
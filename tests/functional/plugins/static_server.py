@@ -0,0 +1,149 @@
+import email.utils
+import functools
+import os
+import threading
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+import pytest
+
+from functional.paths import REPO_DIR
+
+SITE_DIR = REPO_DIR / "out"
+IMMUTABLE_PREFIX = "/_next/static/"
+PRECOMPRESSED_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("static server")
+    group.addoption(
+        "--site-dir",
+        default=str(SITE_DIR),
+        help="exported site (pnpm run export) served when no --base-url is given",
+    )
+
+
+class StaticSiteHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def resolve(self, url_path: str):
+        root = Path(self.directory)
+        path = root / unquote(url_path).lstrip("/")
+        candidates = [path, path / "index.html"]
+        if path != root:
+            candidates.insert(1, path.with_name(f"{path.name}.html"))
+        for candidate in candidates:
+            if candidate.is_file() and candidate.resolve().is_relative_to(root.resolve()):
+                return candidate
+        return None
+
+    def encoded_variant(self, path: Path):
+        accepted = self.headers.get("Accept-Encoding", "")
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            variant = path.with_name(path.name + suffix)
+            if encoding in accepted and variant.is_file():
+                return variant, encoding
+        return path, None
+
+    def send_head(self):
+        url_path = urlparse(self.path).path
+        path = self.resolve(url_path)
+        status = HTTPStatus.OK
+        if path is None:
+            path = self.resolve("/404.html")
+            status = HTTPStatus.NOT_FOUND
+            if path is None:
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return None
+
+        served, encoding = self.encoded_variant(path)
+        stat = served.stat()
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-" + encoding if encoding else ""}"'
+        if status == HTTPStatus.OK and etag in self.headers.get("If-None-Match", ""):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return None
+
+        self.send_response(status)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Content-Length", str(stat.st_size))
+        self.send_header("Last-Modified", email.utils.formatdate(stat.st_mtime, usegmt=True))
+        self.send_header("ETag", etag)
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if url_path.startswith(IMMUTABLE_PREFIX):
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        else:
+            self.send_header("Cache-Control", "public, max-age=0, must-revalidate")
+        self.end_headers()
+        return open(served, "rb")
+
+
+class StaticSiteServer:
+    def __init__(self, site_dir):
+        self.site_dir = Path(site_dir)
+        if not self.site_dir.is_dir():
+            raise pytest.UsageError(f"{self.site_dir} does not exist; run `pnpm run export` or pass --base-url")
+        handler = functools.partial(StaticSiteHandler, directory=os.fspath(self.site_dir))
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_port}/"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def external_base_url(config):
+    base_url = config.getoption("base_url", None)
+    if not base_url:
+        return None
+    return base_url if base_url.endswith("/") else f"{base_url}/"
+
+
+def pytest_configure(config):
+    is_controller = not hasattr(config, "workerinput") and getattr(config.option, "numprocesses", None)
+    if is_controller and external_base_url(config) is None and not config.getoption("collectonly"):
+        config._static_server = StaticSiteServer(config.getoption("site_dir")).start()
+
+
+def pytest_unconfigure(config):
+    server = getattr(config, "_static_server", None)
+    if server is not None:
+        server.stop()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    server = getattr(node.config, "_static_server", None)
+    if server is not None:
+        node.workerinput["static_base_url"] = server.url
+
+
+@pytest.fixture(scope="session")
+def static_site(pytestconfig):
+    base_url = external_base_url(pytestconfig)
+    if base_url is None:
+        base_url = getattr(pytestconfig, "workerinput", {}).get("static_base_url")
+    if base_url is not None:
+        yield base_url
+        return
+    server = StaticSiteServer(pytestconfig.getoption("site_dir")).start()
+    yield server.url
+    server.stop()
@@ -0,0 +1,76 @@
+import json
+from io import BytesIO
+from urllib.parse import urlparse
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from functional.pages.page_types import page_type
+from functional.paths import FUNCTIONAL_DIR
+from functional.visual import PIXEL_THRESHOLD, compare_to_baseline, highlight_tiles, save_baseline
+
+BASELINES_DIR = FUNCTIONAL_DIR / "visual_baselines"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("visual regression")
+    group.addoption(
+        "--update-visual-baselines",
+        action="store_true",
+        default=False,
+        help="overwrite visual baselines with the current screenshots instead of comparing",
+    )
+    group.addoption(
+        "--visual-baselines-dir",
+        default=str(BASELINES_DIR),
+        help="directory of tiled screenshot baselines, one .npz per browser and page",
+    )
+    group.addoption(
+        "--visual-max-diff-ratio",
+        type=float,
+        default=0.001,
+        help="share of a page's pixels allowed to differ from its baseline",
+    )
+    group.addoption(
+        "--visual-pixel-threshold",
+        type=int,
+        default=PIXEL_THRESHOLD,
+        help="per channel difference above which a pixel counts as changed",
+    )
+
+
+def baseline_name(url: str) -> str:
+    path = urlparse(url).path.strip("/")
+    return f"{page_type(url)}/{path.replace('/', '_') or 'index'}"
+
+
+@pytest.fixture
+def visual_check(pytestconfig, reports_dir):
+    baselines_dir = FUNCTIONAL_DIR / pytestconfig.getoption("visual_baselines_dir")
+
+    def _check(page_object, name: str = None):
+        pixels = np.asarray(Image.open(BytesIO(page_object.screenshot())).convert("RGB"))
+        name = name or baseline_name(page_object.page.url)
+        browser_name = page_object.page.context.browser.browser_type.name
+        baseline = baselines_dir / browser_name / f"{name}.npz"
+
+        if pytestconfig.getoption("update_visual_baselines") or not baseline.is_file():
+            created = not baseline.is_file()
+            save_baseline(baseline, pixels)
+            if created and not pytestconfig.getoption("update_visual_baselines"):
+                pytest.skip(f"created visual baseline {baseline.relative_to(baselines_dir)}")
+            return None
+
+        diff = compare_to_baseline(baseline, pixels, pytestconfig.getoption("visual_pixel_threshold"))
+        if diff["diff_ratio"] > pytestconfig.getoption("visual_max_diff_ratio"):
+            report = reports_dir / "visual" / browser_name / name
+            highlight_tiles(pixels, diff["changed_tiles"], report.with_suffix(".png"))
+            report.with_suffix(".json").write_text(json.dumps(diff, indent=2))
+            pytest.fail(
+                f"{name} differs from its baseline in {diff['diff_pixels']} pixels ({diff['diff_ratio']:.2%}) "
+                f"across {len(diff['changed_tiles'])} tiles, see {report.with_suffix('.png')}."
+            )
+        return diff
+
+    return _check
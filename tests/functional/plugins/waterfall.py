@@ -0,0 +1,170 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from functional.pages.base import Base
+from functional.pages.page_types import page_type
+from functional.paths import FUNCTIONAL_DIR, REPORTS_DIR
+
+BUDGETS_FILE = FUNCTIONAL_DIR / "network_budgets.json"
+JS_CHUNK_PATH = "/_next/static/chunks/"
+COMPRESSIBLE_TYPES = ("javascript", "css", "html", "json", "svg", "text/")
+UNCOMPRESSED_MIN_BYTES = 1024
+RESOURCE_TIMING_SCRIPT = """() => Object.fromEntries(
+    [...performance.getEntriesByType("navigation"), ...performance.getEntriesByType("resource")]
+        .map(entry => [entry.name, {protocol: entry.nextHopProtocol, decoded: entry.decodedBodySize}])
+)"""
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("network")
+    group.addoption(
+        "--network-report",
+        action="store_true",
+        default=False,
+        help="record the request waterfall of each page type in an unrouted context and check it against the budgets",
+    )
+    group.addoption(
+        "--network-budgets",
+        default=str(BUDGETS_FILE),
+        help="JSON file of per-page-type transfer budgets (total_kb, requests, js_chunks)",
+    )
+
+
+def resource_entry(request, resource_timing: dict, first_start: float) -> dict:
+    response = request.response() if not request.failure else None
+    headers = response.all_headers() if response else {}
+    sizes = request.sizes() if response else {}
+    timing = request.timing
+    return {
+        "url": request.url,
+        "resource_type": request.resource_type,
+        "method": request.method,
+        "status": response.status if response else None,
+        "failure": request.failure,
+        "protocol": resource_timing.get(request.url, {}).get("protocol"),
+        "content_type": headers.get("content-type"),
+        "content_encoding": headers.get("content-encoding"),
+        "cache_control": headers.get("cache-control"),
+        "etag": headers.get("etag"),
+        "transfer_bytes": sizes.get("responseBodySize", 0) + sizes.get("responseHeadersSize", 0),
+        "encoded_body_bytes": sizes.get("responseBodySize", 0),
+        "decoded_bytes": resource_timing.get(request.url, {}).get("decoded"),
+        "start_ms": timing["startTime"] - first_start,
+        "duration_ms": timing["responseEnd"],
+        "timing": timing,
+    }
+
+
+def summarize_resources(entries: list) -> dict:
+    return {
+        "requests": len(entries),
+        "failed": sum(1 for entry in entries if entry["failure"]),
+        "total_kb": sum(entry["transfer_bytes"] for entry in entries) / 1024,
+        "decoded_kb": sum(entry["decoded_bytes"] or 0 for entry in entries) / 1024,
+        "js_chunks": sum(1 for entry in entries if entry["resource_type"] == "script" and JS_CHUNK_PATH in entry["url"]),
+        "uncompressed": [
+            entry["url"] for entry in entries
+            if not entry["content_encoding"] and entry["encoded_body_bytes"] > UNCOMPRESSED_MIN_BYTES
+            and any(kind in (entry["content_type"] or "") for kind in COMPRESSIBLE_TYPES)
+        ],
+        "uncached_static": [
+            entry["url"] for entry in entries
+            if "/_next/static/" in entry["url"]
+            and "immutable" not in (entry["cache_control"] or "") and "max-age" not in (entry["cache_control"] or "")
+        ],
+        "duration_ms": max((entry["start_ms"] + entry["duration_ms"] for entry in entries), default=0),
+    }
+
+
+class WaterfallRecorder:
+    def __init__(self, budgets: dict):
+        self.budgets = budgets
+        self.pages = {}
+
+    def record(self, page, url: str) -> dict:
+        requests = []
+
+        def on_request(request):
+            requests.append(request)
+
+        page.on("request", on_request)
+        try:
+            Base(page).open(url)
+            page.wait_for_load_state("load")
+        finally:
+            page.remove_listener("request", on_request)
+        resource_timing = page.evaluate(RESOURCE_TIMING_SCRIPT)
+        first_start = min((request.timing["startTime"] for request in requests), default=0)
+        entries = [resource_entry(request, resource_timing, first_start) for request in requests]
+        self.pages[page.url] = {"page_type": page_type(page.url), "summary": summarize_resources(entries), "entries": entries}
+        return self.pages[page.url]
+
+    def budget_violations(self, group: str, summary: dict) -> list:
+        return [
+            f"{metric} is {summary[metric]:.0f}, budget is {limit}"
+            for metric, limit in self.budgets.get(group, {}).items()
+            if summary[metric] > limit
+        ]
+
+    def table(self) -> list:
+        lines = [f"{'url':<60} {'requests':>8} {'total KB':>9} {'decoded KB':>10} {'js chunks':>9} {'uncompressed':>12} {'uncached':>8}"]
+        for url, page in sorted(self.pages.items()):
+            summary = page["summary"]
+            lines.append(
+                f"{url[-60:]:<60} {summary['requests']:>8} {summary['total_kb']:>9.1f} {summary['decoded_kb']:>10.1f} "
+                f"{summary['js_chunks']:>9} {len(summary['uncompressed']):>12} {len(summary['uncached_static']):>8}"
+            )
+        return lines
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "network: records request waterfalls outside the router, only runs with --network-report")
+    if not config.getoption("network_report"):
+        return
+    budgets_path = Path(config.getoption("network_budgets"))
+    config._waterfall_recorder = WaterfallRecorder(json.loads(budgets_path.read_text()) if budgets_path.is_file() else {})
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("network_report"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --network-report to run")
+    for item in items:
+        if item.get_closest_marker("network"):
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(scope="session")
+def network_waterfall(pytestconfig):
+    return getattr(pytestconfig, "_waterfall_recorder", None)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    recorder = getattr(node.config, "_waterfall_recorder", None)
+    if recorder is not None:
+        recorder.pages.update(node.workeroutput.get("waterfall_pages", {}))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    recorder = getattr(config, "_waterfall_recorder", None)
+    if recorder is None:
+        return
+    if hasattr(config, "workerinput"):
+        config.workeroutput["waterfall_pages"] = recorder.pages
+        return
+    if recorder.pages:
+        REPORTS_DIR.mkdir(exist_ok=True)
+        (REPORTS_DIR / "network.json").write_text(json.dumps(recorder.pages, indent=2))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    recorder = getattr(config, "_waterfall_recorder", None)
+    if recorder is None or not recorder.pages:
+        return
+    terminalreporter.section("network waterfall")
+    for line in recorder.table():
+        terminalreporter.write_line(line)
@@ -0,0 +1,53 @@
+import json
+import random
+import re
+
+from functional.paths import CONTENT_DIR
+
+SEARCH_INDEX = CONTENT_DIR / "search" / "index.json"
+WORD = re.compile(r"[A-Za-z][A-Za-z0-9+#.-]*[A-Za-z0-9+#]")
+
+
+def load_index(path=SEARCH_INDEX) -> list:
+    return json.loads(path.read_text())
+
+
+def generate_queries(index: list, count: int = 150, seed: int = 0) -> list:
+    title_words = [WORD.findall(item["title"].lower()) for item in index]
+    words = sorted({word for item in index for field in ("title", "description") for word in WORD.findall(item[field].lower()) if len(word) > 2})
+    candidates = set()
+    for word in words:
+        candidates.update(word[:length] for length in range(2, len(word) + 1))
+    for title in title_words:
+        candidates.update(" ".join(title[position:position + 2]) for position in range(len(title) - 1))
+    rng = random.Random(seed)
+    return rng.sample(sorted(candidates), min(count, len(candidates)))
+
+
+def enlarge_index(index: list, scale: int) -> list:
+    enlarged = list(index)
+    for copy in range(1, scale):
+        enlarged.extend({**item, "slug": f"{item['slug']}-{copy}", "title": f"{item['title']} ({copy})"} for item in index)
+    return enlarged
+
+
+def bundled_json(data) -> str:
+    # webpack emits JSON imports as JSON.parse('<compact json>') with backslashes and single quotes escaped
+    text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return text.replace("\\", "\\\\").replace("'", "\\'")
+
+
+class SearchIndexOverride:
+    def __init__(self, index: list, replacement: list):
+        self.original = bundled_json(index)
+        self.replacement = bundled_json(replacement)
+        self.replaced = False
+
+    def handle(self, route):
+        response = route.fetch()
+        body = response.text()
+        if self.original in body:
+            body = body.replace(self.original, self.replacement)
+            self.replaced = True
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in ("content-encoding", "content-length")}
+        route.fulfill(status=response.status, headers=headers, body=body)
@@ -0,0 +1,26 @@
+import json
+import re
+from pathlib import Path
+
+SHARD_SUFFIX = re.compile(r"@shard-\d+$")
+
+
+def load_durations(path) -> dict:
+    try:
+        return json.loads(Path(path).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def balance_shards(nodeids: list, durations: dict, shard_count: int) -> dict:
+    known = sorted(durations[nodeid] for nodeid in nodeids if nodeid in durations)
+    default_duration = known[len(known) // 2] if known else 1.0
+    weighted = sorted(nodeids, key=lambda nodeid: durations.get(nodeid, default_duration), reverse=True)
+
+    loads = [0.0] * shard_count
+    shards = {}
+    for nodeid in weighted:
+        shard = loads.index(min(loads))
+        loads[shard] += durations.get(nodeid, default_duration)
+        shards[nodeid] = shard
+    return shards
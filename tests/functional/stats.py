@@ -0,0 +1,19 @@
+import math
+
+
+def percentile(values, p: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = (len(ordered) - 1) * p / 100
+    lower, upper = math.floor(rank), math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(values, percentiles=(50, 75, 95, 99)) -> dict:
+    values = [value for value in values if value is not None]
+    if not values:
+        return {}
+    summary = {"count": len(values), "min": min(values), "max": max(values)}
+    summary.update({f"p{p}": percentile(values, p) for p in percentiles})
+    return summary
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+from datetime import datetime
+
+from functional.crawler import page_paths
+from functional.pages import elements
+from functional.pages.aio.footer import Footer
+from functional.pages.aio.home_page import HomePage
+
+
+async def open_page(context, page_class, url):
+    page_object = page_class(await context.new_page())
+    await page_object.open(url)
+    return page_object
+
+
+@pytest.mark.asyncio
+async def test_footer_copyrights_year_on_all_pages(async_context, base_url):
+    test_data = page_paths()
+    footers = await asyncio.gather(*(open_page(async_context, Footer, f"{base_url}{test_path}") for test_path, _ in test_data))
+    years = await asyncio.gather(*(footer.get_year_cr_text(xpath=elements.FOOTER_CR_YEAR_XPATH) for footer in footers))
+
+    for (_, test_id), year in zip(test_data, years):
+        assert year == datetime.now().date().year, f"Wrong copyrights year on {test_id}."
+
+
+@pytest.mark.asyncio
+async def test_footer_links_exist_on_all_pages(async_context, base_url):
+    test_data = page_paths()
+    footers = await asyncio.gather(*(open_page(async_context, Footer, f"{base_url}{test_path}") for test_path, _ in test_data))
+    xpaths = [elements.FOOTER_ABOUT_ME_LINK_XPATH, elements.FOOTER_BLOG_POSTS_LINK_XPATH, elements.FOOTER_HOME_LINK_XPATH]
+
+    for (_, test_id), footer in zip(test_data, footers):
+        results = await asyncio.gather(*(footer.check_element_exists(xpath=xpath) for xpath in xpaths))
+        assert all(results), f"Footer link not found on {test_id}."
+
+
+@pytest.mark.asyncio
+async def test_home_page_headers(async_page, base_url):
+    home_page = HomePage(async_page)
+    await home_page.open(base_url)
+    main_header_text, main_header_text2, newest_blogs_text = await asyncio.gather(
+        home_page.get_main_header_text(),
+        home_page.get_main_header_text2(),
+        home_page.get_newest_blogs_text(),
+    )
+
+    assert main_header_text == "Welcome to"
+    assert main_header_text2 == "Kazi's Dev Blog"
+    assert newest_blogs_text == "Newest Blog Posts(See All)"
@@ -1,3 +1,5 @@
+import pytest
+
 from functional.pages import elements
 from functional.pages.blogs_categories import BlogCategories
 
@@ -18,6 +20,7 @@ def test_tag_page_navigation(sync_page, base_url):
     assert "tags/python" in url.lower()
 
 
+@pytest.mark.visual
 def test_first_article_in_tag_page_has_correct_tag(sync_page, base_url):
     tags_page = BlogCategories(sync_page)
     tags_page.open(base_url)
@@ -1,7 +1,10 @@
+import pytest
+
 from functional.pages import elements
 from functional.pages.home_page import HomePage
 
 
+@pytest.mark.smoke
 def test_page_title(sync_page, base_url):
     home_page = HomePage(sync_page)
     home_page.open(base_url)
@@ -90,3 +93,12 @@ def test_discover_all_articles_link_navigation(sync_page, base_url):
     home_page.open(base_url)
     link_url = home_page.click_link("link", xpath=elements.HOMEPAGE_DISCOVER_ARTICLES_BUTTON_XPATH)
     assert link_url == f"{base_url}blogs", "Link navigation failed."
+
+
+@pytest.mark.smoke
+def test_all_homepage_elements_exist(sync_page, base_url):
+    home_page = HomePage(sync_page)
+    home_page.open(base_url)
+    elements_exist = home_page.check_elements_exist(elements.HOMEPAGE_ELEMENTS)
+    missing = [name for name, exists in elements_exist.items() if not exists]
+    assert not missing, f"Elements not found: {', '.join(missing)}."
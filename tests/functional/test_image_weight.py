@@ -0,0 +1,63 @@
+import json
+from urllib.parse import urlparse
+
+import pytest
+
+from functional.pages.base import Base
+from functional.paths import CONTENT_DIR
+from functional.tools.optimize_images import load_manifest
+
+pytestmark = [pytest.mark.visual, pytest.mark.benchmark]
+
+BLOGS_DIR = CONTENT_DIR / "blogs"
+RENDERED_WIDTHS_SCRIPT = "() => [...document.images].map(image => [new URL(image.src).pathname, image.clientWidth * devicePixelRatio])"
+image_posts = sorted(path.stem for path in BLOGS_DIR.glob("*.md") if "](/images/" in path.read_text())
+
+
+def best_variant(entry: dict, rendered_width: float) -> dict:
+    wide_enough = [variant for variant in entry["variants"] if variant["width"] >= min(rendered_width, entry["width"])]
+    return min(wide_enough or entry["variants"], key=lambda variant: variant["bytes"])
+
+
+@pytest.mark.parametrize("slug", image_posts)
+def test_blog_images_have_smaller_optimized_variants(sync_page, base_url, slug, reports_dir):
+    manifest = load_manifest()
+    if not manifest:
+        pytest.skip("no optimized image manifest, run functional.tools.optimize_images first")
+    responses = {}
+
+    def on_response(response):
+        if response.request.resource_type == "image":
+            responses[urlparse(response.url).path] = response
+
+    sync_page.on("response", on_response)
+    try:
+        Base(sync_page).open(f"{base_url}blogs/{slug}")
+        sync_page.wait_for_load_state("load")
+        rendered_widths = dict(sync_page.evaluate(RENDERED_WIDTHS_SCRIPT))
+        served = {path: len(response.body()) for path, response in responses.items() if path.startswith("/images/")}
+    finally:
+        sync_page.remove_listener("response", on_response)
+
+    images, missing = {}, []
+    for path, served_bytes in served.items():
+        if path.startswith("/images/optimized/"):
+            images[path] = {"served_bytes": served_bytes, "optimized_bytes": served_bytes}
+        elif path in manifest:
+            variant = best_variant(manifest[path], rendered_widths.get(path, manifest[path]["width"]))
+            images[path] = {"served_bytes": served_bytes, "optimized_bytes": variant["bytes"], "variant": variant["path"]}
+        else:
+            missing.append(path)
+
+    report_path = reports_dir / "image_weight.json"
+    report = json.loads(report_path.read_text()) if report_path.is_file() else {}
+    report[slug] = {
+        "served_bytes": sum(image["served_bytes"] for image in images.values()),
+        "optimized_bytes": sum(image["optimized_bytes"] for image in images.values()),
+        "images": images,
+    }
+    report_path.write_text(json.dumps(report, indent=2))
+
+    assert served, f"No local images were served on {slug}."
+    assert not missing, f"Images without optimized variants, run functional.tools.optimize_images: {', '.join(missing)}."
+    assert report[slug]["optimized_bytes"] <= report[slug]["served_bytes"], f"Optimized variants on {slug} are larger than the served images."
@@ -1,96 +1,84 @@
 import pytest
 
+from functional.crawler import page_paths
 from functional.pages import elements
 from functional.pages.navbar import NavBar
 
-test_data = [
-    ('https:localhost:3000/', "homepage"),
-    ('https:localhost:3000/about', "about page"),
-    ('https:localhost:3000/blogs', "blogs page"),
-    ('https:localhost:3000/blogs/python-type-checking', "blog page")
-]
 
+def pytest_generate_tests(metafunc):
+    if "test_path" in metafunc.fixturenames:
+        test_data = page_paths()
+        metafunc.parametrize("test_path, test_id", test_data, ids=[item[1] for item in test_data])
 
-@pytest.mark.parametrize("test_url, test_id", test_data, ids=[item[1] for item in test_data])
-def test_logo_element_exists(sync_page, test_url, test_id):
-    home_page = NavBar(sync_page)
-    home_page.open(test_url)
-    link = sync_page.locator('role=link >> text=Kazis Dev Blog Kazi\'s Dev Blog')
+
+def test_logo_element_exists(page_snapshot, base_url, test_path, test_id):
+    home_page = page_snapshot(NavBar, f"{base_url}{test_path}")
+    link = home_page.page.locator('role=link >> text=Kazis Dev Blog Kazi\'s Dev Blog')
     assert link, "Link not found."
 
 
-@pytest.mark.parametrize("test_url, test_id", test_data, ids=[item[1] for item in test_data])
-def test_about_me_element_exists(sync_page, test_url, test_id):
-    home_page = NavBar(sync_page)
-    home_page.open(test_url)
-    link = sync_page.locator('role=link >> text=About Me')
+def test_about_me_element_exists(page_snapshot, base_url, test_path, test_id):
+    home_page = page_snapshot(NavBar, f"{base_url}{test_path}")
+    link = home_page.page.locator('role=link >> text=About Me')
     assert link, "Link not found."
 
 
-@pytest.mark.parametrize("test_url, test_id", test_data, ids=[item[1] for item in test_data])
-def test_about_me_link_navigation(sync_page, test_url, test_id):
+def test_about_me_link_navigation(sync_page, base_url, test_path, test_id):
     home_page = NavBar(sync_page)
-    home_page.open(test_url)
+    home_page.open(f"{base_url}{test_path}")
     link_url = home_page.click_link(role="link", name="About Me")
     assert "about" in link_url, "Link navigation failed."
 
 
-@pytest.mark.parametrize("test_url, test_id", test_data, ids=[item[1] for item in test_data])
-def test_blog_posts_element_exists(sync_page, test_url, test_id):
-    home_page = NavBar(sync_page)
-    home_page.open(test_url)
-    link = sync_page.locator('role=link >> text=Blog Posts')
+def test_blog_posts_element_exists(page_snapshot, base_url, test_path, test_id):
+    home_page = page_snapshot(NavBar, f"{base_url}{test_path}")
+    link = home_page.page.locator('role=link >> text=Blog Posts')
     assert link, "Link not found."
 
 
-@pytest.mark.parametrize("test_url, test_id", test_data, ids=[item[1] for item in test_data])
-def test_blog_posts_link_navigation(sync_page, test_url, test_id):
+def test_blog_posts_link_navigation(sync_page, base_url, test_path, test_id):
     home_page = NavBar(sync_page)
-    home_page.open(test_url)
+    home_page.open(f"{base_url}{test_path}")
     link_url = home_page.click_link(role="link", name="Blogs")
     assert "blogs" in link_url, "Link navigation failed."
 
 
-@pytest.mark.parametrize("test_url, test_id", test_data, ids=[item[1] for item in test_data])
-def test_home_element_exists(sync_page, test_url, test_id):
-    home_page = NavBar(sync_page)
-    home_page.open(test_url)
-    link = sync_page.locator('role=link >> text=Home')
+def test_home_element_exists(page_snapshot, base_url, test_path, test_id):
+    home_page = page_snapshot(NavBar, f"{base_url}{test_path}")
+    link = home_page.page.locator('role=link >> text=Home')
     assert link, "Link not found."
 
 
-@pytest.mark.parametrize("test_url, test_id", test_data, ids=[item[1] for item in test_data])
-def test_home_link_navigation(sync_page, test_url, test_id):
+def test_home_link_navigation(sync_page, base_url, test_path, test_id):
     home_page = NavBar(sync_page)
-    home_page.open(test_url)
+    home_page.open(f"{base_url}{test_path}")
     link_url = home_page.click_link("link", name="Home")
-    assert link_url == "https://www.kazis.dev/", "Link navigation failed."
+    assert link_url == base_url, "Link navigation failed."
 
 
-@pytest.mark.parametrize("test_url, test_id", test_data, ids=[item[1] for item in test_data])
-def test_search_exists(sync_page, test_url, test_id):
-    home_page = NavBar(sync_page)
-    home_page.open(test_url)
-    link = sync_page.locator('role=link >> text=Search')
+@pytest.mark.smoke
+def test_search_exists(page_snapshot, base_url, test_path, test_id):
+    home_page = page_snapshot(NavBar, f"{base_url}{test_path}")
+    link = home_page.page.locator('role=link >> text=Search')
     assert link, "Link not found."
 
 
-@pytest.mark.parametrize("test_url, test_id", test_data, ids=[item[1] for item in test_data])
-def test_search_functionality_mouse(sync_page, test_url, test_id):
+@pytest.mark.real_content
+def test_search_functionality_mouse(sync_page, base_url, test_path, test_id):
     home_page = NavBar(sync_page)
-    home_page.open(test_url)
+    home_page.open(f"{base_url}{test_path}")
     sync_page.locator("[placeholder=\"Search\"]").click()
     sync_page.locator("[placeholder=\"Search\"]").fill("python")
     with sync_page.expect_navigation():
         sync_page.locator("[aria-label=\"Global\"] >> text=Crafting Meaningful Custom Exceptions in Python: Best Practices and Common Techn").click()
     link = sync_page.url
-    assert link == "https://www.kazis.dev/blogs/python-custom-exceptions"
+    assert link == f"{base_url}blogs/python-custom-exceptions"
 
 
-@pytest.mark.parametrize("test_url, test_id", test_data, ids=[item[1] for item in test_data])
-def test_search_functionality_keyboard(sync_page, test_url, test_id):
+@pytest.mark.real_content
+def test_search_functionality_keyboard(sync_page, base_url, test_path, test_id):
     home_page = NavBar(sync_page)
-    home_page.open(test_url)
+    home_page.open(f"{base_url}{test_path}")
     sync_page.locator("[placeholder=\"Search\"]").click()
     sync_page.locator("[placeholder=\"Search\"]").fill("python")
     with sync_page.expect_navigation():
@@ -98,23 +86,21 @@ def test_search_functionality_keyboard(sync_page, test_url, test_id):
         sync_page.keyboard.down("ArrowDown")
         sync_page.keyboard.press("Enter")
     link = sync_page.url
-    assert link == "https://www.kazis.dev/blogs/python-custom-exceptions"
+    assert link == f"{base_url}blogs/python-custom-exceptions"
 
 
-@pytest.mark.parametrize("test_url, test_id", test_data, ids=[item[1] for item in test_data])
-def test_search_functionality_esc(sync_page, test_url, test_id):
+def test_search_functionality_esc(sync_page, base_url, test_path, test_id):
     home_page = NavBar(sync_page)
-    home_page.open(test_url)
+    home_page.open(f"{base_url}{test_path}")
     sync_page.locator("[placeholder=\"Search\"]").click()
     sync_page.locator("[placeholder=\"Search\"]").fill("python")
     sync_page.keyboard.press("Escape")
     assert sync_page.locator(elements.NAVBAR_SEARCH_BOX_RESULTS_XPATH).is_hidden(), "Search results not hidden."
 
 
-@pytest.mark.parametrize("test_url, test_id", test_data, ids=[item[1] for item in test_data])
-def test_search_functionality_click_somewhere_else(sync_page, test_url, test_id):
+def test_search_functionality_click_somewhere_else(sync_page, base_url, test_path, test_id):
     home_page = NavBar(sync_page)
-    home_page.open(test_url)
+    home_page.open(f"{base_url}{test_path}")
     sync_page.locator("[placeholder=\"Search\"]").click()
     sync_page.locator("[placeholder=\"Search\"]").fill("python")
     sync_page.locator(elements.FOOTER_CR_YEAR_XPATH).click()
@@ -0,0 +1,25 @@
+import pytest
+
+from functional.crawler import seed_paths
+from functional.pages.page_types import page_type
+
+pytestmark = pytest.mark.network
+
+
+def pytest_generate_tests(metafunc):
+    if "test_path" in metafunc.fixturenames:
+        paths = {}
+        for path in seed_paths():
+            paths.setdefault(page_type(f"/{path}"), path)
+        metafunc.parametrize("test_path", list(paths.values()), ids=list(paths))
+
+
+def test_page_within_network_budget(browser, base_url, network_waterfall, test_path):
+    context = browser.new_context()
+    try:
+        recorded = network_waterfall.record(context.new_page(), f"{base_url}{test_path}")
+    finally:
+        context.close()
+
+    violations = network_waterfall.budget_violations(recorded["page_type"], recorded["summary"])
+    assert not violations, f"Network budget exceeded on /{test_path}: {'; '.join(violations)}."
@@ -0,0 +1,43 @@
+import json
+import re
+
+import pytest
+
+from functional.pages.navbar import NavBar
+from functional.search_queries import SearchIndexOverride, enlarge_index, generate_queries, load_index
+from functional.stats import summarize
+
+pytestmark = pytest.mark.benchmark
+
+CHUNKS = re.compile(r"/_next/static/chunks/.*\.js$")
+
+
+def pytest_generate_tests(metafunc):
+    if "search_scale" in metafunc.fixturenames:
+        scales = [int(scale) for scale in metafunc.config.getoption("search_scales").split(",")]
+        metafunc.parametrize("search_scale", scales, ids=[f"x{scale}" for scale in scales])
+
+
+def test_search_latency(sync_page, base_url, search_scale, reports_dir):
+    index = load_index()
+    override = SearchIndexOverride(index, enlarge_index(index, search_scale))
+    if search_scale > 1:
+        sync_page.route(CHUNKS, override.handle)
+    try:
+        navbar = NavBar(sync_page)
+        navbar.open(base_url)
+        if search_scale > 1:
+            assert override.replaced, "Search index not found in any JS chunk, cannot enlarge it."
+        latencies = navbar.measure_search_latency(generate_queries(index))
+    finally:
+        if search_scale > 1:
+            sync_page.unroute(CHUNKS, override.handle)
+
+    report_path = reports_dir / "search_benchmark.json"
+    report = json.loads(report_path.read_text()) if report_path.is_file() else {}
+    report[f"x{search_scale}"] = {
+        "documents": len(index) * search_scale,
+        "latency_ms_by_query_length": {length: summarize(values) for length, values in sorted(latencies.items())},
+    }
+    report_path.write_text(json.dumps(report, indent=2))
+    assert latencies, "No search latencies were recorded."
@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+from functional.crawler import LinkChecker, format_report, seed_paths
+
+pytestmark = pytest.mark.crawl
+
+
+@pytest.mark.asyncio
+async def test_no_broken_links(async_context, async_playwright_context, base_url, pytestconfig, reports_dir):
+    request_context = await async_playwright_context.request.new_context()
+    checker = LinkChecker(
+        async_context,
+        request_context,
+        base_url,
+        workers=pytestconfig.getoption("crawl_workers"),
+        check_external=not pytestconfig.getoption("crawl_skip_external"),
+    )
+    broken = await checker.crawl(seed_paths())
+    await request_context.dispose()
+
+    (reports_dir / "broken_links.json").write_text(json.dumps(broken, indent=2))
+    assert not broken, f"Broken links found on {len(broken)} pages:\n{format_report(broken)}"
@@ -0,0 +1,20 @@
+from urllib.parse import quote
+
+import pytest
+
+from functional.crawler import blog_slugs, blog_tags
+from functional.pages.base import Base
+
+pytestmark = pytest.mark.visual
+
+
+def pytest_generate_tests(metafunc):
+    if "test_path" in metafunc.fixturenames:
+        test_data = ['', 'about', 'blogs', 'tags'] + [f"tags/{quote(tag)}" for tag in blog_tags()[:1]] + [f"blogs/{slug}" for slug in blog_slugs()]
+        metafunc.parametrize("test_path", test_data, ids=[path or "homepage" for path in test_data])
+
+
+def test_page_matches_visual_baseline(sync_page, base_url, visual_check, test_path):
+    page = Base(sync_page)
+    page.open(f"{base_url}{test_path}")
+    visual_check(page)
@@ -0,0 +1,136 @@
+import argparse
+import functools
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import yaml
+
+from functional.paths import CONTENT_DIR
+
+MANIFEST_VERSION = 1
+FRONT_MATTER = re.compile(r"\A---\s*\n(.*?)\n---\s*(?:\n|\Z)", re.DOTALL)
+
+
+def parse_front_matter(text: str) -> dict:
+    match = FRONT_MATTER.match(text)
+    data = yaml.safe_load(match.group(1)) if match else {}
+    return {key: value.isoformat() if isinstance(value, date) else value for key, value in (data or {}).items()}
+
+
+def write_atomic(path: Path, text: str):
+    # NamedTemporaryFile creates the file as 0600, keep the mode the target had
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o644
+    with tempfile.NamedTemporaryFile("w", dir=path.parent, prefix=f".{path.name}.", delete=False, encoding="utf8") as temporary:
+        temporary.write(text)
+        temporary.flush()
+        os.fchmod(temporary.fileno(), mode)
+        os.fsync(temporary.fileno())
+    os.replace(temporary.name, path)
+
+
+class ContentIndex:
+    def __init__(self, content_dir=CONTENT_DIR):
+        content_dir = Path(content_dir)
+        self.blogs_dir = content_dir / "blogs"
+        self.index_path = content_dir / "search" / "index.json"
+        self.manifest_path = content_dir / "search" / "manifest.json"
+
+    def load_manifest(self) -> dict:
+        try:
+            manifest = json.loads(self.manifest_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return manifest["posts"] if manifest.get("version") == MANIFEST_VERSION else {}
+
+    def scan(self) -> tuple:
+        previous = self.load_manifest()
+        posts = {}
+        removed = sorted(set(previous) - {path.name for path in self.blogs_dir.glob("*.md")})
+        changes = {"added": [], "changed": [], "removed": removed, "unchanged": []}
+        for path in sorted(self.blogs_dir.glob("*.md")):
+            stat = path.stat()
+            entry = previous.get(path.name)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                posts[path.name] = entry
+                changes["unchanged"].append(path.name)
+                continue
+
+            content = path.read_bytes()
+            digest = hashlib.sha256(content).hexdigest()
+            if entry and entry["sha256"] == digest:
+                posts[path.name] = {**entry, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+                changes["unchanged"].append(path.name)
+                continue
+
+            posts[path.name] = {
+                "slug": path.stem,
+                "sha256": digest,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "front_matter": parse_front_matter(content.decode("utf8")),
+            }
+            changes["changed" if entry else "added"].append(path.name)
+        return posts, changes
+
+    @staticmethod
+    def search_items(posts: dict) -> list:
+        # same fields and newest-first order as saveSearchData in lib/md.ts
+        ordered = sorted(posts.values(), key=lambda post: str(post["front_matter"].get("date", "")), reverse=True)
+        return [
+            {
+                "slug": post["slug"],
+                "title": post["front_matter"].get("title"),
+                "description": post["front_matter"].get("description"),
+                "category": "blogs",
+            }
+            for post in ordered
+        ]
+
+    def update(self, write: bool = True) -> tuple:
+        posts, changes = self.scan()
+        index_text = json.dumps(self.search_items(posts), indent=2, ensure_ascii=False)
+        stale = not self.index_path.is_file() or self.index_path.read_text(encoding="utf8") != index_text
+        if write:
+            if stale:
+                write_atomic(self.index_path, index_text)
+            self.write_manifest(posts)
+        return posts, changes, stale
+
+    def write_manifest(self, posts: dict):
+        write_atomic(self.manifest_path, json.dumps({"version": MANIFEST_VERSION, "posts": posts}, indent=1, ensure_ascii=False))
+
+
+@functools.cache
+def current_posts(content_dir=CONTENT_DIR) -> list:
+    index = ContentIndex(content_dir)
+    posts, _ = index.scan()
+    # keep the manifest current so later runs only stat the posts instead of hashing and parsing them
+    if posts != index.load_manifest():
+        index.write_manifest(posts)
+    return [{"slug": post["slug"], **post["front_matter"]} for post in posts.values()]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="incrementally rebuild content/search/index.json from the posts that changed")
+    parser.add_argument("--content-dir", type=Path, default=CONTENT_DIR)
+    parser.add_argument("--check", action="store_true", help="only report, exit 1 when the search index is out of date")
+    args = parser.parse_args(argv)
+
+    _, changes, stale = ContentIndex(args.content_dir).update(write=not args.check)
+    print(", ".join(f"{kind} {len(names)}" for kind, names in changes.items()))
+    for kind in ("added", "changed", "removed"):
+        for name in changes[kind]:
+            print(f"  {kind}: {name}")
+    if stale:
+        print("search index is out of date" if args.check else "search index rewritten")
+    return 1 if args.check and stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+import argparse
+import asyncio
+import functools
+import json
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from playwright.async_api import async_playwright
+
+from functional.network import BLOCKED_RESOURCE_TYPES, STUBBED_URL_PATTERNS
+from functional.pages import elements
+from functional.pages.aio.blogs_categories import BlogCategories
+from functional.pages.aio.footer import Footer
+from functional.pages.aio.home_page import HomePage
+from functional.pages.aio.navbar import NavBar
+from functional.paths import REPO_DIR, REPORTS_DIR
+from functional.plugins.static_server import StaticSiteServer
+from functional.stats import summarize
+
+DEFAULT_MIX = "home=4,browse_python_tag=3,search=2,footer_about=1"
+SERVER_START_TIMEOUT = 120
+IMAGE_JOURNEYS = {"browse_python_tag"}
+
+
+async def home(page, base_url, step):
+    home_page = HomePage(page)
+    async with step("home"):
+        await home_page.open(base_url)
+    async with step("see all blogs"):
+        await home_page.click_link("link", xpath=elements.HOMEPAGE_SEE_ALL_LINK_XPATH)
+
+
+async def browse_python_tag(page, base_url, step):
+    tags_page = BlogCategories(page)
+    async with step("home and tags"):
+        await tags_page.open(base_url)
+    async with step("python tag"):
+        await tags_page.navigate_to_python_tag(xpath=elements.BLOGS_CATEGORIES_PYTHON_TAG)
+    async with step("first article"):
+        await tags_page.navigate_to_first_article_in_python_tag(xpath=elements.BLOGS_CATEGORIES_FIRST_ARTICLE_XPATH)
+
+
+async def search(page, base_url, step):
+    navbar = NavBar(page)
+    async with step("home"):
+        await navbar.open(base_url)
+    async with step("search python"):
+        await navbar.search("python")
+    async with step("open result"):
+        await navbar.open_first_search_result()
+
+
+async def footer_about(page, base_url, step):
+    footer = Footer(page)
+    async with step("blogs"):
+        await footer.open(f"{base_url}blogs")
+    async with step("about"):
+        await footer.click_link("link", xpath=elements.FOOTER_ABOUT_ME_LINK_XPATH)
+
+
+JOURNEYS = {
+    "home": home,
+    "browse_python_tag": browse_python_tag,
+    "search": search,
+    "footer_about": footer_about,
+}
+
+
+def parse_mix(mix: str) -> dict:
+    weights = {}
+    for entry in mix.split(","):
+        name, _, weight = entry.partition("=")
+        if name not in JOURNEYS:
+            raise ValueError(f"unknown journey {name!r}, expected one of {', '.join(JOURNEYS)}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+async def block_heavy_assets(route, keep_images: bool = False):
+    request = route.request
+    blocked_types = BLOCKED_RESOURCE_TYPES - {"image"} if keep_images else BLOCKED_RESOURCE_TYPES
+    if request.resource_type in blocked_types or any(pattern.search(request.url) for pattern in STUBBED_URL_PATTERNS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class LoadStats:
+    def __init__(self):
+        self.steps = defaultdict(list)
+        self.step_errors = Counter()
+        self.completed = Counter()
+        self.failed = Counter()
+        self.errors = Counter()
+        self.start_lags = []
+        self.responses = 0
+        self.server_errors = 0
+
+    @asynccontextmanager
+    async def step(self, journey: str, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.step_errors[f"{journey}: {name}"] += 1
+            raise
+        self.steps[f"{journey}: {name}"].append((time.perf_counter() - start) * 1000)
+
+    def count_response(self, response):
+        self.responses += 1
+        if response.status >= 500:
+            self.server_errors += 1
+
+    def report(self, elapsed: float) -> dict:
+        completed, failed = sum(self.completed.values()), sum(self.failed.values())
+        return {
+            "elapsed_seconds": elapsed,
+            "throughput": {
+                "journeys_per_second": completed / elapsed,
+                "steps_per_second": sum(len(latencies) for latencies in self.steps.values()) / elapsed,
+                "responses_per_second": self.responses / elapsed,
+            },
+            "journeys": {
+                name: {
+                    "completed": self.completed[name],
+                    "failed": self.failed[name],
+                    "error_rate": self.failed[name] / ((self.completed[name] + self.failed[name]) or 1),
+                }
+                for name in sorted(set(self.completed) | set(self.failed))
+            },
+            "error_rate": failed / ((completed + failed) or 1),
+            "steps": {
+                name: {
+                    **summarize(self.steps[name]),
+                    "errors": self.step_errors[name],
+                    "error_rate": self.step_errors[name] / ((len(self.steps[name]) + self.step_errors[name]) or 1),
+                }
+                for name in sorted(set(self.steps) | set(self.step_errors))
+            },
+            "http": {
+                "responses": self.responses,
+                "server_errors": self.server_errors,
+                "server_error_rate": self.server_errors / (self.responses or 1),
+            },
+            "start_lag_ms": summarize(self.start_lags),
+            "errors": dict(self.errors.most_common(20)),
+        }
+
+
+async def run_journey(browser, base_url: str, name: str, stats: LoadStats, timeout_ms: float):
+    context = await browser.new_context()
+    context.set_default_timeout(timeout_ms)
+    # the tag journey clicks an article's cover image, which has to load to be clickable
+    await context.route("**/*", functools.partial(block_heavy_assets, keep_images=name in IMAGE_JOURNEYS))
+    try:
+        page = await context.new_page()
+        page.on("response", stats.count_response)
+        await JOURNEYS[name](page, base_url, functools.partial(stats.step, name))
+        stats.completed[name] += 1
+    except Exception as error:
+        stats.failed[name] += 1
+        stats.errors[f"{name}: {type(error).__name__}: {(str(error).splitlines() or [''])[0]}"] += 1
+    finally:
+        try:
+            await context.close()
+        except Exception as error:
+            stats.errors[f"{name}: closing context: {type(error).__name__}: {(str(error).splitlines() or [''])[0]}"] += 1
+
+
+async def closed_loop(browser, base_url, weights, users, deadline, stats, seed, timeout_ms):
+    async def user(number):
+        rng = random.Random(seed + number)
+        while time.perf_counter() < deadline:
+            name = rng.choices(list(weights), weights=list(weights.values()))[0]
+            await run_journey(browser, base_url, name, stats, timeout_ms)
+
+    await asyncio.gather(*(user(number) for number in range(users)))
+
+
+async def open_loop(browser, base_url, weights, users, deadline, stats, seed, timeout_ms, rate):
+    rng = random.Random(seed)
+    slots = asyncio.Semaphore(users)
+
+    async def scheduled_journey(name, scheduled_at):
+        async with slots:
+            stats.start_lags.append((time.perf_counter() - scheduled_at) * 1000)
+            await run_journey(browser, base_url, name, stats, timeout_ms)
+
+    tasks, start = [], time.perf_counter()
+    while (scheduled_at := start + len(tasks) / rate) < deadline:
+        await asyncio.sleep(max(0.0, scheduled_at - time.perf_counter()))
+        name = rng.choices(list(weights), weights=list(weights.values()))[0]
+        tasks.append(asyncio.create_task(scheduled_journey(name, scheduled_at)))
+    await asyncio.gather(*tasks)
+
+
+async def generate_load(base_url, weights, users, duration, rate, seed, timeout_ms) -> dict:
+    stats = LoadStats()
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch()
+        try:
+            start = time.perf_counter()
+            deadline = start + duration
+            if rate:
+                await open_loop(browser, base_url, weights, users, deadline, stats, seed, timeout_ms, rate)
+            else:
+                await closed_loop(browser, base_url, weights, users, deadline, stats, seed, timeout_ms)
+            elapsed = time.perf_counter() - start
+        finally:
+            await browser.close()
+    return stats.report(elapsed)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_serving(url: str, process, timeout: float = SERVER_START_TIMEOUT):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"next exited with code {process.returncode} before serving {url}")
+        try:
+            with urllib.request.urlopen(url, timeout=5):
+                return
+        except OSError:
+            time.sleep(0.5)
+    raise RuntimeError(f"{url} was not reachable after {timeout}s")
+
+
+def print_report(report: dict):
+    throughput = report["throughput"]
+    print(
+        f"{throughput['journeys_per_second']:.2f} journeys/s, {throughput['steps_per_second']:.2f} steps/s, "
+        f"{throughput['responses_per_second']:.1f} responses/s, error rate {report['error_rate']:.2%}, "
+        f"5xx {report['http']['server_errors']}/{report['http']['responses']}"
+    )
+    width = max((len(name) for name in report["steps"]), default=0)
+    print(f"{'step':<{width}} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for name, step in report["steps"].items():
+        print(
+            f"{name:<{width}} {step.get('count', 0):>7} {step.get('p50', 0):>9.1f} "
+            f"{step.get('p95', 0):>9.1f} {step.get('p99', 0):>9.1f} {step['errors']:>7}"
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="replay weighted user journeys through the page objects across concurrent browser contexts")
+    parser.add_argument(
+        "--server",
+        choices=["static", "start", "dev"],
+        default="start",
+        help=(
+            "start runs `next start` on the last build, which serves prerendered pages; "
+            "dev runs `next dev`, where getStaticProps (getBlogs, getRelatedBlogs) runs on every request; "
+            "static load-tests the suite's Python file server over out/, not Next"
+        ),
+    )
+    parser.add_argument("--base-url", help="load an already running server instead of starting one")
+    parser.add_argument("--site-dir", type=Path, default=REPO_DIR / "out", help="exported site served with --server static")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"journey weights, one of {', '.join(JOURNEYS)}")
+    parser.add_argument("--users", type=int, default=10, help="concurrent browser contexts")
+    parser.add_argument("--duration", type=float, default=60, help="seconds to generate load for")
+    parser.add_argument("--rate", type=float, help="start this many journeys per second instead of looping each user back to back")
+    parser.add_argument("--timeout", type=float, default=30, help="seconds before a single step counts as failed")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=REPORTS_DIR / "load.json")
+    args = parser.parse_args(argv)
+
+    try:
+        weights = parse_mix(args.mix)
+    except ValueError as error:
+        parser.error(str(error))
+
+    server = process = None
+    if args.base_url:
+        base_url = args.base_url if args.base_url.endswith("/") else f"{args.base_url}/"
+    elif args.server == "static":
+        if not args.site_dir.is_dir():
+            parser.error(f"{args.site_dir} does not exist; run `pnpm run export` or pass --base-url")
+        server = StaticSiteServer(args.site_dir).start()
+        base_url = server.url
+    else:
+        if args.server == "start" and not (REPO_DIR / ".next" / "BUILD_ID").is_file():
+            parser.error("no production build found; run `pnpm build` first, or use --server dev")
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}/"
+        process = subprocess.Popen([str(REPO_DIR / "node_modules" / ".bin" / "next"), args.server, "-p", str(port)], cwd=REPO_DIR)
+
+    try:
+        if process is not None:
+            wait_until_serving(base_url, process)
+        report = asyncio.run(generate_load(base_url, weights, args.users, args.duration, args.rate, args.seed, args.timeout * 1000))
+    finally:
+        if server is not None:
+            server.stop()
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    server_kind = "external" if args.base_url else args.server
+    report.update({"base_url": base_url, "server": server_kind, "users": args.users, "rate": args.rate, "mix": weights})
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2))
+    print_report(report)
+    return 1 if report["error_rate"] or report["http"]["server_errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageOps, features
+
+from functional.paths import REPO_DIR
+from functional.tools.content_index import write_atomic
+
+PUBLIC_DIR = REPO_DIR / "public"
+SOURCE_DIR = PUBLIC_DIR / "images"
+OUTPUT_DIR = SOURCE_DIR / "optimized"
+MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
+SOURCE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp", ".avif"}
+WIDTHS = (480, 960, 1440)
+FORMAT_OPTIONS = {
+    "avif": {"quality": 50},
+    "webp": {"quality": 75, "method": 6},
+}
+
+
+def available_formats() -> list:
+    return [image_format for image_format in FORMAT_OPTIONS if features.check(image_format)]
+
+
+def public_path(path: Path) -> str:
+    return "/" + path.relative_to(PUBLIC_DIR).as_posix()
+
+
+def target_widths(width: int) -> list:
+    return sorted({candidate for candidate in WIDTHS if candidate < width} | {min(width, WIDTHS[-1])})
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def optimize(source: Path, digest: str, formats: list, output_dir: Path) -> dict:
+    with Image.open(source) as opened:
+        image = ImageOps.exif_transpose(opened)
+        has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        variants = []
+        for width in target_widths(image.width):
+            height = round(image.height * width / image.width)
+            resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+            for image_format in formats:
+                path = output_dir / f"{source.stem}-{digest[:8]}-{width}.{image_format}"
+                resized.save(path, format=image_format.upper(), **FORMAT_OPTIONS[image_format])
+                variants.append({"format": image_format, "width": width, "height": height, "path": public_path(path), "bytes": path.stat().st_size})
+        return {"sha256": digest, "width": image.width, "height": image.height, "bytes": source.stat().st_size, "variants": variants}
+
+
+def is_cached(entry: dict, digest: str, formats: list) -> bool:
+    if entry is None or entry["sha256"] != digest:
+        return False
+    if {variant["format"] for variant in entry["variants"]} != set(formats):
+        return False
+    return all((PUBLIC_DIR / variant["path"].lstrip("/")).is_file() for variant in entry["variants"])
+
+
+def load_manifest(path=MANIFEST_PATH) -> dict:
+    try:
+        return json.loads(Path(path).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="convert public/images to responsive AVIF/WebP variants, skipping unchanged inputs")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of processes used for encoding")
+    args = parser.parse_args(argv)
+
+    formats = available_formats()
+    if "avif" not in formats:
+        print("warning: this Pillow build cannot encode AVIF, writing WebP only", file=sys.stderr)
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    previous = load_manifest()
+    manifest, pending = {}, {}
+    for source in sorted(path for path in SOURCE_DIR.iterdir() if path.suffix.lower() in SOURCE_SUFFIXES):
+        digest = file_digest(source)
+        if is_cached(previous.get(public_path(source)), digest, formats):
+            manifest[public_path(source)] = previous[public_path(source)]
+        else:
+            pending[public_path(source)] = (source, digest)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {key: executor.submit(optimize, source, digest, formats, OUTPUT_DIR) for key, (source, digest) in pending.items()}
+        for key, future in futures.items():
+            manifest[key] = future.result()
+
+    referenced = {Path(variant["path"]).name for entry in manifest.values() for variant in entry["variants"]}
+    for stale in OUTPUT_DIR.iterdir():
+        if stale != MANIFEST_PATH and stale.name not in referenced:
+            stale.unlink()
+    write_atomic(MANIFEST_PATH, json.dumps(dict(sorted(manifest.items())), indent=2))
+
+    original_bytes = sum(entry["bytes"] for entry in manifest.values())
+    largest_variant_bytes = sum(max(variant["bytes"] for variant in entry["variants"]) for entry in manifest.values())
+    print(
+        f"encoded {len(pending)}, cached {len(manifest) - len(pending)}, "
+        f"originals {original_bytes / 1024:.0f} KB, largest variants {largest_variant_bytes / 1024:.0f} KB"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from functional.crawler import blog_tags
+from functional.paths import FUNCTIONAL_DIR, REPO_DIR, REPORTS_DIR
+
+SKIPPED_ENTRIES = {".git", ".next", "content", "node_modules", "out", "tests"}
+EXPORT_ENV = {"NEXT_EXPORT": "true"}
+# test_visual would screenshot every generated post, and real_content tests assert on posts that are not generated
+SUITE_COMMAND = [sys.executable, "-m", "pytest", "-q", "-m", "not real_content", "--ignore", "test_visual.py"]
+AUTHOR = "Or Kazaz"
+AUTHOR_IMAGE = "https://avatars.githubusercontent.com/u/83350680?v=4"
+COVER_IMAGE = "https://images.unsplash.com/photo-1607799279861-4dd421887fb3?auto=format&fit=crop&w=1540&q=50"
+CODE_SAMPLES = {
+    "python": "def handler(event):\n    items = [item for item in event[\"items\"] if item]\n    return {\"count\": len(items)}\n",
+    "javascript": "const handler = async (event) => {\n  const items = event.items.filter(Boolean);\n  return { count: items.length };\n};\n",
+    "bash": "for file in content/blogs/*.md; do\n  wc -w \"$file\"\ndone\n",
+}
+
+
+def vocabulary(blogs_dir=REPO_DIR / "content" / "blogs") -> list:
+    words = set()
+    for path in Path(blogs_dir).glob("*.md"):
+        body = path.read_text().split("---", 2)[-1]
+        words.update(word.strip(".,:;!?()[]\"'`").lower() for word in body.split())
+    return sorted(word for word in words if word.isalpha() and 2 < len(word) < 14)
+
+
+def sentence(rng: random.Random, words: list, length: int) -> str:
+    return " ".join(rng.choice(words) for _ in range(length)).capitalize()
+
+
+def synthetic_post(rng: random.Random, words: list, tags: list, number: int) -> tuple:
+    title = sentence(rng, words, rng.randint(4, 9))
+    description = sentence(rng, words, rng.randint(12, 24)) + "."
+    published = date(2020, 1, 1) + timedelta(days=rng.randint(0, 1500))
+    front_matter = [
+        "---",
+        f"title: {json.dumps(title)}",
+        f"description: {description}",
+        f"author: {AUTHOR}",
+        f"authorImage: {AUTHOR_IMAGE}",
+        f"coverImage: {COVER_IMAGE}",
+        f"date: \"{published.isoformat()}\"",
+        f"tags: {json.dumps(rng.sample(tags, rng.randint(1, 3)))}",
+        "---",
+    ]
+    sections = []
+    for _ in range(rng.randint(3, 6)):
+        sections.append(f"## {sentence(rng, words, rng.randint(2, 5))}")
+        sections.extend(" ".join(sentence(rng, words, rng.randint(8, 20)) + "." for _ in range(rng.randint(3, 6))) for _ in range(rng.randint(1, 3)))
+        language = rng.choice(list(CODE_SAMPLES))
+        sections.append(f"```{language}\n{CODE_SAMPLES[language]}```")
+    slug = f"synthetic-post-{number:05d}"
+    item = {"slug": slug, "title": title, "description": description, "category": "blogs", "date": published.isoformat()}
+    return slug, "\n".join(front_matter) + "\n\n" + "\n\n".join(sections) + "\n", item
+
+
+def generate_content(content_dir: Path, count: int, seed: int = 0) -> int:
+    rng = random.Random(seed)
+    words, tags = vocabulary(), blog_tags()
+    blogs_dir = content_dir / "blogs"
+    shutil.rmtree(content_dir, ignore_errors=True)
+    blogs_dir.mkdir(parents=True)
+    search_items = []
+    for number in range(count):
+        slug, markdown, item = synthetic_post(rng, words, tags, number)
+        (blogs_dir / f"{slug}.md").write_text(markdown)
+        search_items.append(item)
+
+    # the navbar bundles content/search/index.json at compile time, before pages/index.tsx regenerates it
+    search_items.sort(key=lambda item: item.pop("date"), reverse=True)
+    (content_dir / "search").mkdir()
+    index_path = content_dir / "search" / "index.json"
+    index_path.write_text(json.dumps(search_items, indent=2))
+    return sum(path.stat().st_size for path in blogs_dir.iterdir())
+
+
+def prepare_project(workdir: Path) -> Path:
+    project = workdir / "site"
+    if not project.exists():
+        shutil.copytree(REPO_DIR, project, ignore=lambda directory, names: SKIPPED_ENTRIES & set(names) if directory == str(REPO_DIR) else set())
+        (project / "node_modules").symlink_to(REPO_DIR / "node_modules")
+    shutil.rmtree(project / ".next", ignore_errors=True)
+    shutil.rmtree(project / "out", ignore_errors=True)
+    return project
+
+
+def run_measured(command: list, cwd: Path, env: dict = None) -> dict:
+    start = time.perf_counter()
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(command, cwd=cwd, env={**os.environ, **(env or {})}, stdout=subprocess.DEVNULL, stderr=stderr_file)
+        _, status, usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode(errors="replace")
+    if process.returncode != 0:
+        raise RuntimeError(f"{' '.join(command)} failed with exit code {process.returncode}:\n{stderr[-2000:]}")
+    return {"seconds": time.perf_counter() - start, "peak_rss_mb": usage.ru_maxrss / 1024}
+
+
+def directory_size(path: Path) -> int:
+    return sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
+
+
+def measure(workdir: Path, count: int, seed: int, run_suite: bool) -> dict:
+    project = prepare_project(workdir)
+    markdown_bytes = generate_content(project / "content", count, seed)
+    next_bin = str(project / "node_modules" / ".bin" / "next")
+    build = run_measured([next_bin, "build"], project, EXPORT_ENV)
+    export = run_measured([next_bin, "export", "-o", "out"], project, EXPORT_ENV)
+    result = {
+        "posts": count,
+        "markdown_bytes": markdown_bytes,
+        "build_seconds": build["seconds"],
+        "build_peak_rss_mb": build["peak_rss_mb"],
+        "export_seconds": export["seconds"],
+        "index_bytes": (project / "content" / "search" / "index.json").stat().st_size,
+        "out_bytes": directory_size(project / "out"),
+    }
+    if run_suite:
+        start = time.perf_counter()
+        suite = subprocess.run(SUITE_COMMAND + [
+            "--site-dir", str(project / "out"),
+            "--impact-map", str(workdir / "impact_map.json"),
+            "--durations-path", str(workdir / "test_durations.json"),
+        ], cwd=FUNCTIONAL_DIR, env={**os.environ, "FUNCTIONAL_CONTENT_DIR": str(project / "content")})
+        result["suite_seconds"] = time.perf_counter() - start
+        result["suite_exit_code"] = suite.returncode
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="generate N synthetic blog posts, build the site against them and record how it scales")
+    parser.add_argument("--sizes", default="1000,5000,10000,50000", help="comma separated post counts")
+    parser.add_argument("--workdir", type=Path, default=Path("/tmp/kazi-blog-scaling"), help="scratch directory for the generated site")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--run-suite", action="store_true", help="also run the functional suite against every generated build")
+    parser.add_argument("--output", type=Path, default=REPORTS_DIR / "scaling.json")
+    args = parser.parse_args(argv)
+
+    if not (REPO_DIR / "node_modules").is_dir():
+        parser.error(f"{REPO_DIR / 'node_modules'} is missing, run pnpm install first")
+    args.workdir.mkdir(parents=True, exist_ok=True)
+    results = []
+    for count in (int(size) for size in args.sizes.split(",")):
+        result = measure(args.workdir, count, args.seed, args.run_suite)
+        results.append(result)
+        print(" ".join(f"{key}={value:.2f}" if isinstance(value, float) else f"{key}={value}" for key, value in result.items()), flush=True)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
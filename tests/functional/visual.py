@@ -0,0 +1,103 @@
+import hashlib
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+FORMAT_VERSION = 1
+TILE_SIZE = 64
+HASH_GRID = 8
+HASH_LEVELS = 32
+PIXEL_THRESHOLD = 16
+GRAYSCALE_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def to_tiles(pixels: np.ndarray, tile_size: int = TILE_SIZE) -> np.ndarray:
+    height, width, channels = pixels.shape
+    rows, cols = -(-height // tile_size), -(-width // tile_size)
+    padded = np.full((rows * tile_size, cols * tile_size, channels), 255, dtype=np.uint8)
+    padded[:height, :width] = pixels
+    return padded.reshape(rows, tile_size, cols, tile_size, channels).swapaxes(1, 2)
+
+
+def tile_hashes(tiles: np.ndarray) -> np.ndarray:
+    rows, cols, tile_size = tiles.shape[:3]
+    block = tile_size // HASH_GRID
+    gray = tiles @ GRAYSCALE_WEIGHTS
+    means = gray.reshape(rows, cols, HASH_GRID, block, HASH_GRID, block).mean(axis=(3, 5))
+    return (means * HASH_LEVELS / 256).astype(np.uint8).reshape(rows, cols, HASH_GRID * HASH_GRID)
+
+
+def save_baseline(path, pixels: np.ndarray, tile_size: int = TILE_SIZE):
+    tiles = to_tiles(pixels, tile_size)
+    rows, cols = tiles.shape[:2]
+    tile_index = np.empty((rows, cols), dtype=np.int32)
+    unique = {}
+    for row, col in np.ndindex(rows, cols):
+        digest = hashlib.blake2b(tiles[row, col].tobytes(), digest_size=16).digest()
+        tile_index[row, col] = unique.setdefault(digest, (len(unique), tiles[row, col]))[0]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(
+        path,
+        format_version=FORMAT_VERSION,
+        shape=np.array(pixels.shape),
+        tile_size=tile_size,
+        hashes=tile_hashes(tiles),
+        tile_index=tile_index,
+        **{f"tile_{index}": tile for index, tile in unique.values()},
+    )
+
+
+def compare_to_baseline(path, pixels: np.ndarray, pixel_threshold: int = PIXEL_THRESHOLD) -> dict:
+    with np.load(path) as baseline:
+        if int(baseline["format_version"]) != FORMAT_VERSION:
+            raise ValueError(f"{path} has baseline format {int(baseline['format_version'])}, expected {FORMAT_VERSION}")
+        tile_size = int(baseline["tile_size"])
+        base_height = int(baseline["shape"][0])
+        tiles = to_tiles(pixels, tile_size)
+        rows, cols = tiles.shape[:2]
+        base_hashes, tile_index = baseline["hashes"], baseline["tile_index"]
+        if tuple(baseline["shape"][1:]) != pixels.shape[1:]:
+            return {
+                "tiles": rows * cols,
+                "hash_changed": rows * cols,
+                "changed_tiles": [[row, col] for row, col in np.ndindex(rows, cols)],
+                "diff_pixels": pixels.shape[0] * pixels.shape[1],
+                "diff_ratio": 1.0,
+                "size_changed": True,
+            }
+
+        common = min(rows, base_hashes.shape[0])
+        hash_changed = np.ones((rows, cols), dtype=bool)
+        hash_changed[:common] = (tile_hashes(tiles[:common]) != base_hashes[:common]).any(axis=-1)
+
+        diff_counts = np.zeros((rows, cols), dtype=np.int64)
+        diff_counts[common:] = tile_size * tile_size
+        compared = np.argwhere(hash_changed[:common])
+        if len(compared):
+            base_tiles = np.stack([baseline[f"tile_{tile_index[row, col]}"] for row, col in compared])
+            current_tiles = tiles[compared[:, 0], compared[:, 1]]
+            differs = np.abs(current_tiles.astype(np.int16) - base_tiles).max(axis=-1) > pixel_threshold
+            diff_counts[compared[:, 0], compared[:, 1]] = differs.sum(axis=(1, 2))
+
+    # baseline rows below the current screenshot's last tile have nothing to compare against, so all of them differ
+    missing_pixels = max(0, base_height - rows * tile_size) * pixels.shape[1]
+    diff_pixels = int(diff_counts.sum()) + missing_pixels
+    return {
+        "tiles": rows * cols,
+        "hash_changed": int(hash_changed.sum()),
+        "changed_tiles": np.argwhere(diff_counts > 0).tolist(),
+        "diff_pixels": diff_pixels,
+        "diff_ratio": diff_pixels / (max(pixels.shape[0], base_height) * pixels.shape[1]),
+        "size_changed": base_height != pixels.shape[0],
+    }
+
+
+def highlight_tiles(pixels: np.ndarray, changed_tiles: list, path, tile_size: int = TILE_SIZE):
+    image = Image.fromarray(pixels)
+    draw = ImageDraw.Draw(image)
+    for row, col in changed_tiles:
+        left, top = col * tile_size, row * tile_size
+        draw.rectangle([left, top, left + tile_size - 1, top + tile_size - 1], outline=(255, 0, 0), width=2)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    image.save(path)